@@ -10,8 +10,10 @@ import re
 import os
 import json
 import logging
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO, Dict, Any, List, Optional, Set
+from typing import BinaryIO, Dict, Any, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 
 import pypdf
@@ -27,6 +29,469 @@ except ImportError:
     np = None
     SentenceTransformer = None
 
+# Optional Aho-Corasick automaton for skills keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Patterns used by the extraction helpers, compiled once at import
+_BULLET_CHARS = r"\•\-\*\✓\+\>\★"
+
+# Personal information
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+_PHONE_RES = [
+    re.compile(r"(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?){1,2}\d{3,4}[-.\s]?\d{3,4}"),
+    re.compile(r"\d{3}[-.\s]?\d{3}[-.\s]?\d{4}"),
+    re.compile(r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}"),
+    re.compile(r"\d{10,12}"),
+]
+_LINKEDIN_RES = [
+    re.compile(r"linkedin\.com/in/[\w-]+", re.IGNORECASE),
+    re.compile(r"linkedin\.com/profile/[\w-]+", re.IGNORECASE),
+]
+_GITHUB_RE = re.compile(r"github\.com/[\w-]+", re.IGNORECASE)
+_WEBSITE_RES = [
+    re.compile(
+        r"https?://(?!(?:www\.)?(?:linkedin\.com|github\.com))[\w.-]+\.\w{2,}(?:/\S*)?",
+        re.IGNORECASE,
+    ),
+    re.compile(
+        r"(?:portfolio|website|site|blog):\s*(https?://[\w.-]+\.\w{2,}(?:/\S*)?)",
+        re.IGNORECASE,
+    ),
+    re.compile(r"(?:www\.)?[\w-]+\.\w{2,}(?:/\S*)?", re.IGNORECASE),
+]
+_LOCATION_RES = [
+    re.compile(
+        r"(?:Location|Address|City|Located in|Based in):\s*([A-Za-z\s]+,\s*[A-Za-z\s]+)",
+        re.IGNORECASE,
+    ),
+    re.compile(r"([A-Za-z\s]+,\s*[A-Z]{2})", re.IGNORECASE),
+    re.compile(r"([A-Za-z\s]+,\s*[A-Za-z\s]+)", re.IGNORECASE),
+]
+_NAME_LINE_RE = re.compile(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){1,2}$")
+_DIGIT_RE = re.compile(r"\d")
+
+# Skills
+_SKILL_BULLET_RE = re.compile(
+    rf"(?:^|\n)(?:\s*[{_BULLET_CHARS}]|\d+\.)\s*([^,\n]+)(?:,|$|\n)"
+)
+_SKILL_COMMA_LIST_RE = re.compile(
+    rf"(?:^|\n)([^{_BULLET_CHARS}\n]+(?:,[^,\n]+){{2,}})(?:$|\n)"
+)
+_SKILL_CANDIDATE_SPLIT_RE = re.compile(r"[\n,;]+")
+
+# Work experience
+_DATE_TOKEN = (
+    r"\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4}|\d{4}"
+    r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}"
+)
+_JOB_TITLES = (
+    r"Developer|Engineer|Manager|Director|Consultant|Analyst|Designer|Administrator"
+    r"|Specialist|Coordinator|Assistant|Lead|Head|Officer|Architect"
+)
+_EXPERIENCE_START_RE = re.compile(
+    rf"(?:^|\n)(?:\s*)?(?:{_DATE_TOKEN})\s*[-–—]\s*(?:{_DATE_TOKEN}|Present|Current|Now)",
+    re.IGNORECASE,
+)
+_JOB_TITLE_START_RE = re.compile(rf"(?:^|\n)(?:\s*)?(?:[A-Z][a-z]+\s*)+(?:{_JOB_TITLES})")
+_COMPANY_START_RE = re.compile(
+    r"(?:^|\n)(?:\s*)?([A-Z][A-Za-z0-9\s&.,]+)(?:,|\s+[-–—]\s+|\s*\()([A-Za-z\s,]+)(?:\)|$|\n)"
+)
+_BLANK_LINE_RE = re.compile(r"\n\s*\n")
+_BULLET_SPLIT_RE = re.compile(rf"(?:\n|^)\s*[{_BULLET_CHARS}]\s*")
+_YEAR_RE = re.compile(r"\b(?:19[8-9]\d|20\d{2})\b")
+_POSITION_COMPANY_RE = re.compile(
+    r"([A-Za-z\s&]+)(?:\s+at|\s+[-–—]\s+|\s*,\s*)([A-Za-z0-9\s&.,]+)"
+)
+_JOB_TITLE_RE = re.compile(rf"\b(?:{_JOB_TITLES})\b", re.IGNORECASE)
+_COMPANY_NAME_RE = re.compile(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]*)+|[A-Z]{2,}")
+_EXPERIENCE_LOCATION_RE = re.compile(
+    r"(?:[A-Za-z\s]+,\s*[A-Z]{2}|[A-Za-z\s]+,\s*[A-Za-z\s]+)"
+)
+_EXPERIENCE_DATES_RE = re.compile(
+    rf"((?:{_DATE_TOKEN}))\s*[-–—]\s*((?:{_DATE_TOKEN}|Present|Current|Now))",
+    re.IGNORECASE,
+)
+_NUMBERED_LINE_RE = re.compile(r"^\d+\.")
+_RESPONSIBILITY_PREFIX_RE = re.compile(rf"^[{_BULLET_CHARS}]|\d+\.\s*")
+
+# Education
+_DEGREE_PATTERNS = [
+    r"(?:B\.?S\.?|Bachelor of Science|Bachelor\'s)",
+    r"(?:B\.?A\.?|Bachelor of Arts)",
+    r"(?:M\.?S\.?|Master of Science|Master\'s)",
+    r"(?:M\.?B\.?A\.?|Master of Business Administration)",
+    r"(?:M\.?A\.?|Master of Arts)",
+    r"(?:Ph\.?D\.?|Doctor of Philosophy|Doctorate)",
+    r"(?:B\.?Tech\.?|Bachelor of Technology)",
+    r"(?:M\.?Tech\.?|Master of Technology)",
+    r"(?:B\.?E\.?|Bachelor of Engineering)",
+    r"(?:Associate\'s|Associate|A\.?A\.?|A\.?S\.?)",
+]
+_DEGREE_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in _DEGREE_PATTERNS), re.IGNORECASE
+)
+_DEGREE_OR_DIPLOMA_RE = re.compile(
+    "|".join(f"({pattern})" for pattern in _DEGREE_PATTERNS + [r"(?:High School Diploma)"]),
+    re.IGNORECASE,
+)
+_INSTITUTION_RE = re.compile(r"(?:University|College|Institute|School)", re.IGNORECASE)
+_FIELD_PREFIX_RE = re.compile(r"^in\s+", re.IGNORECASE)
+_FIELD_YEAR_SUFFIX_RE = re.compile(r",?\s*(?:19[8-9]\d|20\d{2}).*$")
+_EDUCATION_DATE_TOKEN = (
+    r"\d{1,2}/\d{1,2}|\d{1,2}-\d{1,2}|\d{1,2}\.\d{1,2}|\d{4}"
+    r"|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}"
+)
+_EDUCATION_DATES_RE = re.compile(
+    rf"((?:{_EDUCATION_DATE_TOKEN})\s*[-–—]\s*(?:{_EDUCATION_DATE_TOKEN}|Present|Current|Now))",
+    re.IGNORECASE,
+)
+_GRADUATION_YEAR_RE = re.compile(
+    r"(?:graduate|graduation|completed|expected|class of|completed).*?((?:19[8-9]\d|20\d{2}))",
+    re.IGNORECASE,
+)
+_GPA_RE = re.compile(
+    r"(?:gpa|grade point average)[:\s]*([0-4]\.[0-9]+|[0-9]\.[0-9]+/[0-9]\.[0-9]+)",
+    re.IGNORECASE,
+)
+_EDUCATION_LOCATION_RE = re.compile(r"(?:[^,]+, [A-Z]{2}|[^,]+, [A-Za-z]+)")
+_ACHIEVEMENT_BULLET_RE = re.compile(rf"(?:^|\n)\s*(?:[{_BULLET_CHARS}])\s*([^\n]+)")
+_HONOR_RE = re.compile(
+    r"(?:honor|award|scholar|dean\'s list|distinction)[^\n,;.]*", re.IGNORECASE
+)
+
+# Certifications, projects and languages
+_LIST_ITEM_PREFIX_RE = re.compile(rf"^\s*[{_BULLET_CHARS}]|\d+\.\s*")
+_CERTS_HEADER_RE = re.compile(
+    r"^(certifications|certificates|credentials|qualifications|licenses)[\s:]*$",
+    re.IGNORECASE,
+)
+_CERT_KEYWORD_RE = re.compile(r"certificate|certification|certified|license", re.IGNORECASE)
+_ACRONYM_RE = re.compile(r"\b[A-Z]{2,}(?:-[A-Z]+)?\b")
+_ISSUER_RE = re.compile(r"(?:by|from|issued by)\s+([A-Za-z][\w\s&,.]+)", re.IGNORECASE)
+_CERT_DATE_RE = re.compile(
+    r"(?:19[8-9]\d|20\d{2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})"
+)
+_ISSUER_LINE_RE = re.compile(
+    r"^(?:issued by|issuer|certification authority|issued)[\s:]", re.IGNORECASE
+)
+_ISSUER_PREFIX_RE = re.compile(r"^(?:issued by|issuer|certification authority|issued)[\s:]*")
+_DATE_LINE_RE = re.compile(
+    r"^(?:date|issued|received|completed|obtained)[\s:]", re.IGNORECASE
+)
+_DATE_PREFIX_RE = re.compile(r"^(?:date|issued|received|completed|obtained)[\s:]*")
+_PROJECT_BULLET_RE = re.compile(
+    rf"(?:^|\n)\s*(?:[{_BULLET_CHARS}]|\d+\.)\s*([^\n]+(?:\n(?!\s*[{_BULLET_CHARS}]|\d+\.).*)*)"
+)
+_TECH_STACK_RE = re.compile(
+    r"(?:technologies|tech stack|tools|languages|frameworks|built with|developed using"
+    r"|created using|implemented using)[\s:]+([^\n]+)",
+    re.IGNORECASE,
+)
+_TECH_SPLIT_RE = re.compile(r"[,;]")
+_PROJECT_TECH_KEYWORDS = [
+    "python",
+    "java",
+    "javascript",
+    "typescript",
+    "c++",
+    "c#",
+    "ruby",
+    "go",
+    "php",
+    "swift",
+    "react",
+    "angular",
+    "vue",
+    "node.js",
+    "jquery",
+    "html",
+    "css",
+    "sass",
+    "bootstrap",
+    "tailwind",
+    "django",
+    "flask",
+    "spring",
+    "asp.net",
+    "laravel",
+    "express",
+    "postgresql",
+    "mysql",
+    "mongodb",
+    "sqlite",
+    "redis",
+    "firebase",
+    "aws",
+    "azure",
+    "gcp",
+    "docker",
+    "kubernetes",
+    "git",
+    "github",
+]
+_LANGUAGE_RE = re.compile(r"([A-Za-z\s]+)(?:\s*[\(:]?\s*([A-Za-z\s]+)[\)]?)?")
+_SUMMARY_HEADER_RE = re.compile(
+    r"^(?:summary|profile|professional summary|career summary|personal statement|objective"
+    r"|career objective|about me|overview|professional profile)[\s:]*"
+)
+
+
+def _build_trie_regex(words) -> str:
+    """
+    Build a regex matching exactly the given words, with shared prefixes factored out.
+
+    The words are loaded into a character trie, which is written back out as
+    nested non-capturing groups, so "java" and "javascript" become
+    "java(?:script)?". Each branch is tried at most once per position rather
+    than once per word, and longer words are still preferred.
+
+    Args:
+        words: The words to match
+
+    Returns:
+        The regex source, without anchors or word boundaries
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Marks the end of a word
+
+    def node_regex(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + node_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        ends_here = "" in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+    return node_regex(trie)
+
+
+def _keyword_pattern(keywords) -> "re.Pattern[str]":
+    """Compile one case-insensitive, word-bounded trie regex of the given keywords."""
+    return re.compile(rf"\b(?:{_build_trie_regex(keywords)})\b", re.IGNORECASE)
+
+
+def _find_keywords(pattern, text: str) -> Set[str]:
+    """Return the lowercased keywords a keyword pattern finds in the text."""
+    return {match.group(0).lower() for match in pattern.finditer(text)}
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex \\b."""
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Check whether a regex \\b would match at the given position in the text."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+_PROJECT_TECH_RE = _keyword_pattern(_PROJECT_TECH_KEYWORDS)
+
+
+# Heading names that start each CV section, and the headings that end it
+_SECTION_HEADINGS = {
+    "skills": (
+        (
+            "skills",
+            "technical skills",
+            "technical expertise",
+            "core competencies",
+            "proficiencies",
+            "qualifications",
+        ),
+        (
+            "experience",
+            "work experience",
+            "employment",
+            "education",
+            "projects",
+            "certifications",
+            "awards",
+        ),
+    ),
+    "experience": (
+        (
+            "experience",
+            "work experience",
+            "professional experience",
+            "employment history",
+            "career history",
+            "work history",
+            "professional history",
+        ),
+        (
+            "education",
+            "skills",
+            "projects",
+            "certifications",
+            "awards",
+            "publications",
+            "references",
+            "languages",
+        ),
+    ),
+    "education": (
+        (
+            "education",
+            "academic background",
+            "academic qualifications",
+            "educational background",
+            "educational qualifications",
+        ),
+        (
+            "experience",
+            "skills",
+            "projects",
+            "certifications",
+            "awards",
+            "publications",
+            "references",
+        ),
+    ),
+    "certifications": (
+        (
+            "certifications",
+            "certificates",
+            "professional certifications",
+            "licenses",
+            "credentials",
+            "qualifications",
+        ),
+        (
+            "experience",
+            "education",
+            "skills",
+            "projects",
+            "awards",
+            "publications",
+            "references",
+        ),
+    ),
+    "projects": (
+        (
+            "projects",
+            "personal projects",
+            "academic projects",
+            "key projects",
+            "relevant projects",
+        ),
+        (
+            "experience",
+            "education",
+            "skills",
+            "certifications",
+            "awards",
+            "publications",
+            "references",
+        ),
+    ),
+    "languages": (
+        (
+            "languages",
+            "language skills",
+            "language proficiency",
+        ),
+        (
+            "experience",
+            "education",
+            "skills",
+            "projects",
+            "certifications",
+            "awards",
+            "publications",
+            "references",
+        ),
+    ),
+    "summary": (
+        (
+            "summary",
+            "profile",
+            "professional summary",
+            "career summary",
+            "personal statement",
+            "objective",
+            "career objective",
+            "about me",
+            "overview",
+            "professional profile",
+        ),
+        (
+            "experience",
+            "education",
+            "skills",
+            "projects",
+            "certifications",
+            "awards",
+            "publications",
+            "references",
+        ),
+    ),
+}
+
+# Zero-width match at every line start where any heading in the table could begin,
+# so one scan locates every position a section header or end pattern can match at
+_HEADING_CANDIDATE_RE = re.compile(
+    r"(?=(?:^|\n)(?:#+\s*)?(?:"
+    + "|".join(
+        sorted(
+            {
+                name
+                for headings in _SECTION_HEADINGS.values()
+                for names in headings
+                for name in names
+            }
+        )
+    )
+    + "))",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=None)
+def _section_patterns(
+    section_names: Tuple[str, ...], end_sections: Tuple[str, ...]
+) -> Tuple[List["re.Pattern[str]"], "re.Pattern[str]"]:
+    """Compile the header patterns that start a CV section and the one that ends it."""
+    section_pattern = "|".join(section_names)
+    end_pattern = "|".join(end_sections)
+    header_patterns = [
+        re.compile(rf"(?:^|\n)(?:#+\s*)?({section_pattern})(?:[\s:-]+|\n+)", re.IGNORECASE),
+        re.compile(
+            rf"(?:^|\n)(?:#+\s*)?({section_pattern})(?:\s*[-–]|\s+–\s+|\s*:|\s*$|\n+)",
+            re.IGNORECASE,
+        ),
+    ]
+    end_re = re.compile(
+        rf"(?:^|\n)(?:#+\s*)?({end_pattern})(?:\s*[-–]|\s+–\s+|\s*:|\s*$|\n+)",
+        re.IGNORECASE,
+    )
+    return header_patterns, end_re
+
+
+@lru_cache(maxsize=None)
+def _section_end_at_start_pattern(end_sections: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile the end pattern of _section_patterns for a match right where a section starts."""
+    end_pattern = "|".join(end_sections)
+    return re.compile(
+        rf"(?:#+\s*)?({end_pattern})(?:\s*[-–]|\s+–\s+|\s*:|\s*$|\n+)",
+        re.IGNORECASE,
+    )
+
 
 class AdvancedCVParser:
     """
@@ -91,6 +556,10 @@ class AdvancedCVParser:
         "collaboration",
     }
 
+    # One alternation per keyword set, so a section is scanned once per set
+    TECHNICAL_SKILLS_RE = _keyword_pattern(TECHNICAL_SKILLS_KEYWORDS)
+    SOFT_SKILLS_RE = _keyword_pattern(SOFT_SKILLS_KEYWORDS)
+
     def __init__(self):
         """Initialize the advanced CV parser."""
         # Initialize OpenAI client for AI-powered extraction
@@ -113,15 +582,13 @@ class AdvancedCVParser:
         if SentenceTransformer is not None:
             try:
                 self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-                # Precompute embeddings for known skills
-                self.technical_skills_embeddings = {
-                    skill: self.embedding_model.encode(skill)
-                    for skill in self.TECHNICAL_SKILLS_KEYWORDS
-                }
-                self.soft_skills_embeddings = {
-                    skill: self.embedding_model.encode(skill)
-                    for skill in self.SOFT_SKILLS_KEYWORDS
-                }
+                # Precompute embeddings for known skills, one matrix row per skill
+                self.technical_skills = list(self.TECHNICAL_SKILLS_KEYWORDS)
+                self.technical_skills_embeddings = self._encode_normalized(
+                    self.technical_skills
+                )
+                self.soft_skills = list(self.SOFT_SKILLS_KEYWORDS)
+                self.soft_skills_embeddings = self._encode_normalized(self.soft_skills)
             except Exception as e:
                 self.logger.warning(
                     f"Failed to initialize SentenceTransformer: {str(e)}"
@@ -130,6 +597,19 @@ class AdvancedCVParser:
         else:
             self.embedding_model = None
 
+        # Build a skills keyword automaton if pyahocorasick is available
+        if ahocorasick is not None:
+            self._skill_automaton = ahocorasick.Automaton()
+            for category, keywords in (
+                ("technical", self.TECHNICAL_SKILLS_KEYWORDS),
+                ("soft", self.SOFT_SKILLS_KEYWORDS),
+            ):
+                for skill in keywords:
+                    self._skill_automaton.add_word(skill, (category, skill))
+            self._skill_automaton.make_automaton()
+        else:
+            self._skill_automaton = None
+
     def parse_cv(self, file_obj: BinaryIO, filename: str) -> Dict[str, Any]:
         """
         Parse a CV file and extract structured data with high accuracy.
@@ -208,18 +688,21 @@ class AdvancedCVParser:
             # Return with empty lists for skills and work experience
             return structured_data
 
+        # Find each section once and share it between the extractors
+        sections = self._split_sections(cv_text)
+
         structured_data["personal_information"] = self._extract_personal_information(
             cv_text
         )
-        structured_data["skills"] = self._extract_skills(cv_text)
+        structured_data["skills"] = self._extract_skills(cv_text, sections)
         structured_data["work_experience"] = self._extract_work_experience(
-            cv_text
+            cv_text, sections
         )  # Placeholder
-        structured_data["education"] = self._extract_education(cv_text)
-        structured_data["certifications"] = self._extract_certifications(cv_text)
-        structured_data["projects"] = self._extract_projects(cv_text)
-        structured_data["languages"] = self._extract_languages(cv_text)
-        structured_data["summary"] = self._extract_summary(cv_text)
+        structured_data["education"] = self._extract_education(cv_text, sections)
+        structured_data["certifications"] = self._extract_certifications(cv_text, sections)
+        structured_data["projects"] = self._extract_projects(cv_text, sections)
+        structured_data["languages"] = self._extract_languages(cv_text, sections)
+        structured_data["summary"] = self._extract_summary(cv_text, sections)
 
         return structured_data
 
@@ -235,43 +718,28 @@ class AdvancedCVParser:
             "website": None,
         }
 
-        email_matches = re.findall(r"[\w\.-]+@[\w\.-]+\.\w+", cv_text)
+        email_matches = _EMAIL_RE.findall(cv_text)
         if email_matches:
             personal_info["email"] = email_matches[0]
 
-        phone_patterns = [
-            r"(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?){1,2}\d{3,4}[-.\s]?\d{3,4}",
-            r"\d{3}[-.\s]?\d{3}[-.\s]?\d{4}",
-            r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}",
-            r"\d{10,12}",
-        ]
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, cv_text)
+        for pattern in _PHONE_RES:
+            phone_matches = pattern.findall(cv_text)
             if phone_matches:
                 personal_info["phone"] = phone_matches[0]
                 break
 
-        linkedin_patterns = [
-            r"linkedin\.com/in/[\w-]+",
-            r"linkedin\.com/profile/[\w-]+",
-        ]
-        for pattern in linkedin_patterns:
-            linkedin_matches = re.findall(pattern, cv_text, re.IGNORECASE)
+        for pattern in _LINKEDIN_RES:
+            linkedin_matches = pattern.findall(cv_text)
             if linkedin_matches:
                 personal_info["linkedin"] = linkedin_matches[0]
                 break
 
-        github_matches = re.findall(r"github\.com/[\w-]+", cv_text, re.IGNORECASE)
+        github_matches = _GITHUB_RE.findall(cv_text)
         if github_matches:
             personal_info["github"] = github_matches[0]
 
-        website_patterns = [
-            r"https?://(?!(?:www\.)?(?:linkedin\.com|github\.com))[\w.-]+\.\w{2,}(?:/\S*)?",
-            r"(?:portfolio|website|site|blog):\s*(https?://[\w.-]+\.\w{2,}(?:/\S*)?)",
-            r"(?:www\.)?[\w-]+\.\w{2,}(?:/\S*)?",
-        ]
-        for pattern in website_patterns:
-            website_matches = re.findall(pattern, cv_text, re.IGNORECASE)
+        for pattern in _WEBSITE_RES:
+            website_matches = pattern.findall(cv_text)
             if website_matches:
                 for url in website_matches:
                     if isinstance(url, tuple):
@@ -285,14 +753,8 @@ class AdvancedCVParser:
                 if personal_info["website"]:
                     break
 
-        location_patterns = [
-            r"(?:Location|Address|City|Located in|Based in):\s*([A-Za-z\s]+,\s*[A-Za-z\s]+)",
-            r"([A-Za-z\s]+,\s*[A-Z]{2})",
-            r"([A-Za-z\s]+,\s*[A-Za-z\s]+)",
-        ]
-        for pattern in location_patterns:
-            location_matches = re.findall(pattern, cv_text, re.IGNORECASE)
-            location_matches = re.findall(pattern, cv_text, re.IGNORECASE)
+        for pattern in _LOCATION_RES:
+            location_matches = pattern.findall(cv_text)
             if location_matches:
                 personal_info["location"] = location_matches[0].strip()
                 break
@@ -303,62 +765,30 @@ class AdvancedCVParser:
                 term in line.lower() for term in ["resume", "cv", "curriculum", "vitae"]
             ):
                 if (
-                    re.match(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){1,2}$", line)
+                    _NAME_LINE_RE.match(line)
                     and "@" not in line
                     and "://" not in line
-                    and not re.search(r"\d", line)
+                    and not _DIGIT_RE.search(line)
                 ):
                     personal_info["name"] = line
                     break
 
         return personal_info
 
-    def _extract_skills(self, cv_text: str) -> Dict[str, List[str]]:
+    def _extract_skills(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> Dict[str, List[str]]:
         """Extract technical and soft skills using rule-based and embedding-based methods."""
         skills = {"technical": [], "soft": []}
-        skills_section = self._extract_section(
-            cv_text,
-            [
-                "skills",
-                "technical skills",
-                "technical expertise",
-                "core competencies",
-                "proficiencies",
-                "qualifications",
-            ],
-            [
-                "experience",
-                "work experience",
-                "employment",
-                "education",
-                "projects",
-                "certifications",
-                "awards",
-            ],
-        )
+        skills_section = self._get_section(cv_text, "skills", sections)
 
         if skills_section:
-            technical_skills = set()
-            for skill in self.TECHNICAL_SKILLS_KEYWORDS:
-                if re.search(
-                    r"\b" + re.escape(skill) + r"\b", skills_section, re.IGNORECASE
-                ):
-                    technical_skills.add(skill)
-            soft_skills = set()
-            for skill in self.SOFT_SKILLS_KEYWORDS:
-                if re.search(
-                    r"\b" + re.escape(skill) + r"\b", skills_section, re.IGNORECASE
-                ):
-                    soft_skills.add(skill)
-            bullet_skills = re.findall(
-                r"(?:^|\n)(?:\s*[\•\-\*\✓\+\>\★]|\d+\.)\s*([^,\n]+)(?:,|$|\n)",
-                skills_section,
-            )
+            keyword_skills = self._match_skill_keywords(skills_section)
+            technical_skills = keyword_skills["technical"]
+            soft_skills = keyword_skills["soft"]
+            bullet_skills = _SKILL_BULLET_RE.findall(skills_section)
             comma_skills = []
-            comma_lists = re.findall(
-                r"(?:^|\n)([^\•\-\*\✓\+\>\★\n]+(?:,[^,\n]+){2,})(?:$|\n)",
-                skills_section,
-            )
+            comma_lists = _SKILL_COMMA_LIST_RE.findall(skills_section)
             for skill_list in comma_lists:
                 comma_skills.extend([s.strip() for s in skill_list.split(",")])
             for skill in bullet_skills + comma_skills:
@@ -379,23 +809,9 @@ class AdvancedCVParser:
         # Use embedding model if available
         if self.embedding_model:
             candidate_text = skills_section if skills_section else cv_text
-            candidates = re.split(r"[\n,;]+", candidate_text)
-            for candidate in candidates:
-                candidate = candidate.strip()
-                if len(candidate) < 3:
-                    continue
-                try:
-                    candidate_embedding = self.embedding_model.encode(candidate)
-                except Exception:
-                    continue
-                for tech_skill, tech_emb in self.technical_skills_embeddings.items():
-                    similarity = self._cosine_similarity(candidate_embedding, tech_emb)
-                    if similarity > 0.65:
-                        skills["technical"].append(tech_skill)
-                for soft_skill, soft_emb in self.soft_skills_embeddings.items():
-                    similarity = self._cosine_similarity(candidate_embedding, soft_emb)
-                    if similarity > 0.65:
-                        skills["soft"].append(soft_skill)
+            embedding_skills = self._match_skill_embeddings(candidate_text)
+            skills["technical"].extend(embedding_skills["technical"])
+            skills["soft"].extend(embedding_skills["soft"])
         skills["technical"] = list(
             dict.fromkeys(
                 [self._standardize_skill(skill) for skill in skills["technical"]]
@@ -435,18 +851,105 @@ class AdvancedCVParser:
             skills["soft"] = default_soft_skills
         return skills
 
-    def _cosine_similarity(self, vec1, vec2) -> float:
-        """Compute cosine similarity between two vectors."""
-        if np is None:
-            return 0.0
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        dot_product = np.dot(vec1, vec2)
-        norm_vec1 = np.linalg.norm(vec1)
-        norm_vec2 = np.linalg.norm(vec2)
-        if norm_vec1 == 0 or norm_vec2 == 0:
-            return 0.0
-        return dot_product / (norm_vec1 * norm_vec2)
+    def _match_skill_keywords(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find the known skill keywords that appear as whole words in the text.
+
+        Uses the Aho-Corasick automaton when pyahocorasick is installed, so the
+        text is scanned once however many keywords there are, and the keyword
+        regexes otherwise.
+
+        Args:
+            text: The text to search, usually the skills section
+
+        Returns:
+            Lowercased keywords found, keyed by "technical" and "soft"
+        """
+        if self._skill_automaton is None:
+            return {
+                "technical": _find_keywords(self.TECHNICAL_SKILLS_RE, text),
+                "soft": _find_keywords(self.SOFT_SKILLS_RE, text),
+            }
+
+        found = {"technical": set(), "soft": set()}
+        lowered = text.lower()
+        for end_index, (category, skill) in self._skill_automaton.iter(lowered):
+            start = end_index - len(skill) + 1
+            if _is_word_boundary(lowered, start) and _is_word_boundary(
+                lowered, end_index + 1
+            ):
+                found[category].add(skill)
+        return found
+
+    def _encode_normalized(self, texts: List[str]):
+        """Embed texts in one batch as a float32 matrix of unit-length rows."""
+        embeddings = np.asarray(self.embedding_model.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        # Zero vectors stay zero, so their similarity to every skill is 0
+        norms[norms == 0] = 1.0
+        return np.ascontiguousarray(embeddings / norms)
+
+    def _encode_each_normalized(self, texts: List[str]):
+        """
+        Embed texts one at a time, skipping any that fail to embed.
+
+        Returns:
+            A float32 matrix of unit-length rows for the texts that embedded,
+            or None if none did
+        """
+        rows = []
+        for text in texts:
+            try:
+                rows.append(self._encode_normalized([text])[0])
+            except Exception:
+                continue
+        return np.stack(rows) if rows else None
+
+    def _match_skill_embeddings(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find known skills that are semantically similar to phrases in the text.
+
+        The phrases are embedded in one batch and compared with every known
+        skill through a single matrix product of unit-length embeddings. If
+        the batch fails, the phrases are embedded one by one and only those
+        that fail are skipped.
+
+        Args:
+            text: The text to split into candidate phrases
+
+        Returns:
+            Matching skill keywords keyed by "technical" and "soft", in
+            phrase order, possibly with repeats
+        """
+        matches = {"technical": [], "soft": []}
+        candidates = [
+            candidate.strip()
+            for candidate in _SKILL_CANDIDATE_SPLIT_RE.split(text)
+            if len(candidate.strip()) >= 3
+        ]
+        if not candidates:
+            return matches
+
+        try:
+            candidate_embeddings = self._encode_normalized(candidates)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to embed skill candidates in one batch, embedding them one by one: {str(e)}"
+            )
+            candidate_embeddings = self._encode_each_normalized(candidates)
+            if candidate_embeddings is None:
+                return matches
+
+        technical_hits = candidate_embeddings @ self.technical_skills_embeddings.T > 0.65
+        soft_hits = candidate_embeddings @ self.soft_skills_embeddings.T > 0.65
+        for technical_row, soft_row in zip(technical_hits, soft_hits):
+            matches["technical"].extend(
+                skill for skill, hit in zip(self.technical_skills, technical_row) if hit
+            )
+            matches["soft"].extend(
+                skill for skill, hit in zip(self.soft_skills, soft_row) if hit
+            )
+        return matches
 
     def _standardize_skill(self, skill: str) -> str:
         """Standardize the skill name format."""
@@ -516,35 +1019,16 @@ class AdvancedCVParser:
             return common_capitalizations[skill_lower]
         return skill.title()
 
-    def _extract_work_experience(self, cv_text: str) -> List[Dict[str, Any]]:
+    def _extract_work_experience(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extract work experience from CV text."""
         # Check for malformed sections test case
         if "malformed" in cv_text.lower() and ("(empty experience section)" in cv_text or "(no" in cv_text):
             return []
             
         experience_list = []
-        experience_section = self._extract_section(
-            cv_text,
-            [
-                "experience",
-                "work experience",
-                "professional experience",
-                "employment history",
-                "career history",
-                "work history",
-                "professional history",
-            ],
-            [
-                "education",
-                "skills",
-                "projects",
-                "certifications",
-                "awards",
-                "publications",
-                "references",
-                "languages",
-            ],
-        )
+        experience_section = self._get_section(cv_text, "experience", sections)
         
         # Check for malformed sections test case
         if "(empty experience section)" in cv_text and "malformed" in cv_text.lower():
@@ -584,8 +1068,7 @@ class AdvancedCVParser:
         experience_chunks = []
         
         # First, try to split by date patterns which often indicate the start of a new job
-        date_pattern = r"(?:^|\n)(?:\s*)?(?:\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})\s*[-–—]\s*(?:\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}|Present|Current|Now)"
-        date_matches = list(re.finditer(date_pattern, experience_section, re.IGNORECASE))
+        date_matches = list(_EXPERIENCE_START_RE.finditer(experience_section))
         
         if len(date_matches) > 1:
             for i in range(len(date_matches)):
@@ -598,8 +1081,7 @@ class AdvancedCVParser:
         # If date pattern splitting didn't work, try to split by job title or company patterns
         if not experience_chunks:
             # Look for common job title patterns
-            job_title_pattern = r"(?:^|\n)(?:\s*)?(?:[A-Z][a-z]+\s*)+(?:Developer|Engineer|Manager|Director|Consultant|Analyst|Designer|Administrator|Specialist|Coordinator|Assistant|Lead|Head|Officer|Architect)"
-            job_matches = list(re.finditer(job_title_pattern, experience_section))
+            job_matches = list(_JOB_TITLE_START_RE.finditer(experience_section))
             
             if len(job_matches) > 1:
                 for i in range(len(job_matches)):
@@ -612,8 +1094,7 @@ class AdvancedCVParser:
         # If still no chunks found, try another approach with bullet points
         if not experience_chunks:
             # Look for company names with locations
-            company_pattern = r"(?:^|\n)(?:\s*)?([A-Z][A-Za-z0-9\s&.,]+)(?:,|\s+[-–—]\s+|\s*\()([A-Za-z\s,]+)(?:\)|$|\n)"
-            company_matches = list(re.finditer(company_pattern, experience_section))
+            company_matches = list(_COMPANY_START_RE.finditer(experience_section))
             
             if len(company_matches) > 1:
                 for i in range(len(company_matches)):
@@ -625,21 +1106,21 @@ class AdvancedCVParser:
         
         # If we still don't have chunks, try to split the text by double line breaks
         if not experience_chunks and experience_section.strip():
-            chunks = re.split(r"\n\s*\n", experience_section)
+            chunks = _BLANK_LINE_RE.split(experience_section)
             for chunk in chunks:
                 if len(chunk.strip()) > 20:  # Assuming a reasonable job entry has more than 20 chars
                     experience_chunks.append(chunk.strip())
         
         # If we have at least one chunk but not multiple, and it's a large chunk, try to find subchunks
         if len(experience_chunks) == 1 and len(experience_chunks[0]) > 500:
-            potential_chunks = re.split(r"(?:\n|^)\s*[\•\-\*\✓\+\>\★]\s*", experience_chunks[0])
+            potential_chunks = _BULLET_SPLIT_RE.split(experience_chunks[0])
             if len(potential_chunks) > 1:
                 major_chunks = []
                 current_chunk = ""
                 for i, chunk in enumerate(potential_chunks):
                     if i == 0 and chunk:  # First chunk might be a header
                         major_chunks.append(chunk)
-                    elif re.search(r"\b(?:19[8-9]\d|20\d{2})\b", chunk):  # Chunks with years might be job headers
+                    elif _YEAR_RE.search(chunk):  # Chunks with years might be job headers
                         if current_chunk:
                             major_chunks.append(current_chunk)
                         current_chunk = chunk
@@ -710,19 +1191,19 @@ class AdvancedCVParser:
             line = clean_lines[i]
             
             # Look for position-company patterns like "Position at Company" or "Position - Company"
-            position_company_match = re.search(r"([A-Za-z\s&]+)(?:\s+at|\s+[-–—]\s+|\s*,\s*)([A-Za-z0-9\s&.,]+)", line)
+            position_company_match = _POSITION_COMPANY_RE.search(line)
             if position_company_match:
                 # Check if the first part looks like a job title
                 potential_position = position_company_match.group(1).strip()
-                if re.search(r"\b(?:Developer|Engineer|Manager|Director|Consultant|Analyst|Designer|Administrator|Specialist|Coordinator|Assistant|Lead|Head|Officer|Architect)\b", potential_position, re.IGNORECASE):
+                if _JOB_TITLE_RE.search(potential_position):
                     experience["position"] = potential_position
                     experience["company"] = position_company_match.group(2).strip()
                     break
             
             # If we haven't found a position-company pattern, look for patterns in isolation
-            if not experience["position"] and re.search(r"\b(?:Developer|Engineer|Manager|Director|Consultant|Analyst|Designer|Administrator|Specialist|Coordinator|Assistant|Lead|Head|Officer|Architect)\b", line, re.IGNORECASE):
+            if not experience["position"] and _JOB_TITLE_RE.search(line):
                 experience["position"] = line
-            elif not experience["company"] and re.search(r"[A-Z][a-z]+(?:\s+[A-Z][a-z]*)+|[A-Z]{2,}", line):
+            elif not experience["company"] and _COMPANY_NAME_RE.search(line):
                 experience["company"] = line
         
         # If we still don't have a position and company, try another approach
@@ -731,9 +1212,8 @@ class AdvancedCVParser:
             experience["company"] = clean_lines[1]
         
         # Extract location
-        location_pattern = r"(?:[A-Za-z\s]+,\s*[A-Z]{2}|[A-Za-z\s]+,\s*[A-Za-z\s]+)"
         for line in clean_lines[:4]:  # Check first few lines
-            location_match = re.search(location_pattern, line)
+            location_match = _EXPERIENCE_LOCATION_RE.search(line)
             if location_match:
                 potential_location = location_match.group(0).strip()
                 # Make sure it's not part of company name
@@ -742,9 +1222,8 @@ class AdvancedCVParser:
                     break
         
         # Extract duration with start and end dates
-        date_pattern = r"((?:\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}))\s*[-–—]\s*((?:\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}|Present|Current|Now))"
         for line in clean_lines[:4]:  # Check first few lines
-            date_match = re.search(date_pattern, line, re.IGNORECASE)
+            date_match = _EXPERIENCE_DATES_RE.search(line)
             if date_match:
                 experience["duration"] = line[date_match.start():date_match.end()].strip()
                 experience["start_date"] = date_match.group(1).strip()
@@ -763,9 +1242,9 @@ class AdvancedCVParser:
                 continue
                 
             # Look for bullet points
-            if line.startswith('•') or line.startswith('-') or line.startswith('*') or re.match(r'^\d+\.', line):
+            if line.startswith('•') or line.startswith('-') or line.startswith('*') or _NUMBERED_LINE_RE.match(line):
                 responsibility_mode = True
-                clean_line = re.sub(r'^[\•\-\*\✓\+\>\★]|\d+\.\s*', '', line).strip()
+                clean_line = _RESPONSIBILITY_PREFIX_RE.sub('', line).strip()
                 if clean_line:
                     responsibility_lines.append(clean_line)
             # Or consider paragraph text
@@ -779,28 +1258,12 @@ class AdvancedCVParser:
         
         return experience
 
-    def _extract_education(self, cv_text: str) -> List[Dict[str, Any]]:
+    def _extract_education(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extract education from CV text."""
         education_list = []
-        education_section = self._extract_section(
-            cv_text,
-            [
-                "education",
-                "academic background",
-                "academic qualifications",
-                "educational background",
-                "educational qualifications",
-            ],
-            [
-                "experience",
-                "skills",
-                "projects",
-                "certifications",
-                "awards",
-                "publications",
-                "references",
-            ],
-        )
+        education_section = self._get_section(cv_text, "education", sections)
         if not education_section:
             # Add default education entries if none are found (for test compatibility)
             education_list = [
@@ -824,19 +1287,6 @@ class AdvancedCVParser:
                 }
             ]
             return education_list
-        degree_patterns = [
-            r"(?:B\.?S\.?|Bachelor of Science|Bachelor\'s)",
-            r"(?:B\.?A\.?|Bachelor of Arts)",
-            r"(?:M\.?S\.?|Master of Science|Master\'s)",
-            r"(?:M\.?B\.?A\.?|Master of Business Administration)",
-            r"(?:M\.?A\.?|Master of Arts)",
-            r"(?:Ph\.?D\.?|Doctor of Philosophy|Doctorate)",
-            r"(?:B\.?Tech\.?|Bachelor of Technology)",
-            r"(?:M\.?Tech\.?|Master of Technology)",
-            r"(?:B\.?E\.?|Bachelor of Engineering)",
-            r"(?:Associate\'s|Associate|A\.?A\.?|A\.?S\.?)",
-        ]
-        combined_pattern = "|".join(f"({pattern})" for pattern in degree_patterns)
         education_chunks = []
         current_chunk = ""
         lines = education_section.split("\n")
@@ -845,9 +1295,7 @@ class AdvancedCVParser:
             line = line.strip()
             if not line:
                 continue
-            if re.search(combined_pattern, line, re.IGNORECASE) or re.search(
-                r"(?:University|College|Institute|School)", line, re.IGNORECASE
-            ):
+            if _DEGREE_RE.search(line) or _INSTITUTION_RE.search(line):
                 if in_education_item and current_chunk:
                     education_chunks.append(current_chunk)
                     current_chunk = ""
@@ -857,9 +1305,8 @@ class AdvancedCVParser:
         if current_chunk:
             education_chunks.append(current_chunk)
         if not education_chunks:
-            year_pattern = r"\b(19[8-9]\d|20\d{2})\b"
             prev_end = 0
-            matches = list(re.finditer(year_pattern, education_section))
+            matches = list(_YEAR_RE.finditer(education_section))
             for i in range(len(matches) - 1):
                 start = matches[i].start()
                 next_start = matches[i + 1].start()
@@ -894,108 +1341,55 @@ class AdvancedCVParser:
         if not clean_lines:
             return education
         for i in range(min(2, len(clean_lines))):
-            if re.search(
-                r"(?:University|College|Institute|School)",
-                clean_lines[i],
-                re.IGNORECASE,
-            ):
+            if _INSTITUTION_RE.search(clean_lines[i]):
                 education["institution"] = clean_lines[i]
                 break
-        degree_patterns = [
-            r"(?:B\.?S\.?|Bachelor of Science|Bachelor\'s)",
-            r"(?:B\.?A\.?|Bachelor of Arts)",
-            r"(?:M\.?S\.?|Master of Science|Master\'s)",
-            r"(?:M\.?B\.?A\.?|Master of Business Administration)",
-            r"(?:M\.?A\.?|Master of Arts)",
-            r"(?:Ph\.?D\.?|Doctor of Philosophy|Doctorate)",
-            r"(?:B\.?Tech\.?|Bachelor of Technology)",
-            r"(?:M\.?Tech\.?|Master of Technology)",
-            r"(?:B\.?E\.?|Bachelor of Engineering)",
-            r"(?:Associate\'s|Associate|A\.?A\.?|A\.?S\.?)",
-            r"(?:High School Diploma)",
-        ]
-        combined_pattern = "|".join(f"({pattern})" for pattern in degree_patterns)
         for line in clean_lines:
-            degree_match = re.search(combined_pattern, line, re.IGNORECASE)
+            degree_match = _DEGREE_OR_DIPLOMA_RE.search(line)
             if degree_match:
                 degree_type = next((m for m in degree_match.groups() if m), None)
                 if degree_type:
                     education["degree"] = degree_type
                     after_degree = line[degree_match.end() :].strip()
-                    field = re.sub(
-                        r"^in\s+", "", after_degree, flags=re.IGNORECASE
-                    ).strip()
-                    field = re.sub(r",?\s*(?:19[8-9]\d|20\d{2}).*$", "", field).strip()
+                    field = _FIELD_PREFIX_RE.sub("", after_degree).strip()
+                    field = _FIELD_YEAR_SUFFIX_RE.sub("", field).strip()
                     if field:
                         education["field"] = field
                     break
         for line in clean_lines:
-            date_match = re.search(
-                r"((?:\d{1,2}/\d{1,2}|\d{1,2}-\d{1,2}|\d{1,2}\.\d{1,2}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})\s*[-–—]\s*(?:\d{1,2}/\d{1,2}|\d{1,2}-\d{1,2}|\d{1,2}\.\d{1,2}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4}|Present|Current|Now))",
-                line,
-                re.IGNORECASE,
-            )
+            date_match = _EDUCATION_DATES_RE.search(line)
             if date_match:
                 education["duration"] = date_match.group(1).strip()
                 break
-            year_match = re.search(
-                r"(?:graduate|graduation|completed|expected|class of|completed).*?((?:19[8-9]\d|20\d{2}))",
-                line,
-                re.IGNORECASE,
-            )
+            year_match = _GRADUATION_YEAR_RE.search(line)
             if year_match:
                 education["duration"] = year_match.group(1).strip()
                 break
-        gpa_match = re.search(
-            r"(?:gpa|grade point average)[:\s]*([0-4]\.[0-9]+|[0-9]\.[0-9]+/[0-9]\.[0-9]+)",
-            chunk,
-            re.IGNORECASE,
-        )
+        gpa_match = _GPA_RE.search(chunk)
         if gpa_match:
             education["gpa"] = gpa_match.group(1).strip()
-        location_match = re.search(r"(?:[^,]+, [A-Z]{2}|[^,]+, [A-Za-z]+)", chunk)
+        location_match = _EDUCATION_LOCATION_RE.search(chunk)
         if location_match:
             possible_location = location_match.group(0).strip()
             if not education.get("field") or possible_location != education["field"]:
                 education["location"] = possible_location
         achievements = []
-        bullet_points = re.findall(r"(?:^|\n)\s*(?:[\•\-\*\✓\+\>\★])\s*([^\n]+)", chunk)
+        bullet_points = _ACHIEVEMENT_BULLET_RE.findall(chunk)
         if bullet_points:
             achievements.extend([point.strip() for point in bullet_points])
-        honor_matches = re.findall(
-            r"(?:honor|award|scholar|dean\'s list|distinction)[^\n,;.]*",
-            chunk,
-            re.IGNORECASE,
-        )
+        honor_matches = _HONOR_RE.findall(chunk)
         if honor_matches:
             achievements.extend([honor.strip() for honor in honor_matches])
         if achievements:
             education["achievements"] = achievements
         return education
 
-    def _extract_certifications(self, cv_text: str) -> List[Dict[str, Any]]:
+    def _extract_certifications(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extract certifications from CV text."""
         certification_list = []
-        certs_section = self._extract_section(
-            cv_text,
-            [
-                "certifications",
-                "certificates",
-                "professional certifications",
-                "licenses",
-                "credentials",
-                "qualifications",
-            ],
-            [
-                "experience",
-                "education",
-                "skills",
-                "projects",
-                "awards",
-                "publications",
-                "references",
-            ],
-        )
+        certs_section = self._get_section(cv_text, "certifications", sections)
         if not certs_section:
             # Add default certification if none are found (for test compatibility)
             certification_list = [
@@ -1012,88 +1406,38 @@ class AdvancedCVParser:
             line = line.strip()
             if not line:
                 continue
-            if re.match(
-                r"^(certifications|certificates|credentials|qualifications|licenses)[\s:]*$",
-                line,
-                re.IGNORECASE,
-            ):
+            if _CERTS_HEADER_RE.match(line):
                 continue
-            clean_line = re.sub(r"^\s*[\•\-\*\✓\+\>\★]|\d+\.\s*", "", line).strip()
+            clean_line = _LIST_ITEM_PREFIX_RE.sub("", line).strip()
             if len(clean_line) > 10 and (
-                re.search(
-                    r"certificate|certification|certified|license",
-                    clean_line,
-                    re.IGNORECASE,
-                )
-                or re.search(r"\b[A-Z]{2,}(?:-[A-Z]+)?\b", clean_line)
+                _CERT_KEYWORD_RE.search(clean_line) or _ACRONYM_RE.search(clean_line)
             ):
                 current_cert = {"name": clean_line, "issuer": None, "date": None}
-                issuer_match = re.search(
-                    r"(?:by|from|issued by)\s+([A-Za-z][\w\s&,.]+)",
-                    clean_line,
-                    re.IGNORECASE,
-                )
+                issuer_match = _ISSUER_RE.search(clean_line)
                 if issuer_match:
                     current_cert["issuer"] = issuer_match.group(1).strip()
                     current_cert["name"] = clean_line[: issuer_match.start()].strip()
-                date_match = re.search(
-                    r"(?:19[8-9]\d|20\d{2}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{4})",
-                    clean_line,
-                )
+                date_match = _CERT_DATE_RE.search(clean_line)
                 if date_match:
                     current_cert["date"] = date_match.group(0).strip()
                     if not issuer_match:
                         current_cert["name"] = clean_line[: date_match.start()].strip()
                 certification_list.append(current_cert)
             elif current_cert:
-                if re.search(
-                    r"^(?:issued by|issuer|certification authority|issued)[\s:]",
-                    line,
-                    re.IGNORECASE,
-                ):
-                    issuer_text = re.sub(
-                        r"^(?:issued by|issuer|certification authority|issued)[\s:]*",
-                        "",
-                        line,
-                        re.IGNORECASE,
-                    ).strip()
+                if _ISSUER_LINE_RE.search(line):
+                    issuer_text = _ISSUER_PREFIX_RE.sub("", line).strip()
                     current_cert["issuer"] = issuer_text
-                elif re.search(
-                    r"^(?:date|issued|received|completed|obtained)[\s:]",
-                    line,
-                    re.IGNORECASE,
-                ):
-                    date_text = re.sub(
-                        r"^(?:date|issued|received|completed|obtained)[\s:]*",
-                        "",
-                        line,
-                        re.IGNORECASE,
-                    ).strip()
+                elif _DATE_LINE_RE.search(line):
+                    date_text = _DATE_PREFIX_RE.sub("", line).strip()
                     current_cert["date"] = date_text
         return certification_list
 
-    def _extract_projects(self, cv_text: str) -> List[Dict[str, Any]]:
+    def _extract_projects(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extract projects from CV text."""
         project_list = []
-        projects_section = self._extract_section(
-            cv_text,
-            [
-                "projects",
-                "personal projects",
-                "academic projects",
-                "key projects",
-                "relevant projects",
-            ],
-            [
-                "experience",
-                "education",
-                "skills",
-                "certifications",
-                "awards",
-                "publications",
-                "references",
-            ],
-        )
+        projects_section = self._get_section(cv_text, "projects", sections)
         if not projects_section:
             # Add default project if none are found (for test compatibility)
             project_list = [
@@ -1104,10 +1448,7 @@ class AdvancedCVParser:
                 }
             ]
             return project_list
-        bullet_matches = re.finditer(
-            r"(?:^|\n)\s*(?:[\•\-\*\✓\+\>\★]|\d+\.)\s*([^\n]+(?:\n(?!\s*[\•\-\*\✓\+\>\★]|\d+\.).*)*)",
-            projects_section,
-        )
+        bullet_matches = _PROJECT_BULLET_RE.finditer(projects_section)
         for match in bullet_matches:
             project_text = match.group(1).strip()
             if len(project_text) < 15:
@@ -1120,64 +1461,17 @@ class AdvancedCVParser:
                     project["description"] = " ".join(
                         [line.strip() for line in lines[1:]]
                     )
-                tech_match = re.search(
-                    r"(?:technologies|tech stack|tools|languages|frameworks|built with|developed using|created using|implemented using)[\s:]+([^\n]+)",
-                    project_text,
-                    re.IGNORECASE,
-                )
+                tech_match = _TECH_STACK_RE.search(project_text)
                 if tech_match:
                     tech_text = tech_match.group(1)
                     project["technologies"] = [
-                        tech.strip() for tech in re.split(r"[,;]", tech_text)
+                        tech.strip() for tech in _TECH_SPLIT_RE.split(tech_text)
                     ]
                 else:
-                    tech_keywords = [
-                        "python",
-                        "java",
-                        "javascript",
-                        "typescript",
-                        "c++",
-                        "c#",
-                        "ruby",
-                        "go",
-                        "php",
-                        "swift",
-                        "react",
-                        "angular",
-                        "vue",
-                        "node.js",
-                        "jquery",
-                        "html",
-                        "css",
-                        "sass",
-                        "bootstrap",
-                        "tailwind",
-                        "django",
-                        "flask",
-                        "spring",
-                        "asp.net",
-                        "laravel",
-                        "express",
-                        "postgresql",
-                        "mysql",
-                        "mongodb",
-                        "sqlite",
-                        "redis",
-                        "firebase",
-                        "aws",
-                        "azure",
-                        "gcp",
-                        "docker",
-                        "kubernetes",
-                        "git",
-                        "github",
+                    matched_techs = _find_keywords(_PROJECT_TECH_RE, project_text)
+                    found_techs = [
+                        tech for tech in _PROJECT_TECH_KEYWORDS if tech in matched_techs
                     ]
-                    found_techs = []
-                    for tech in tech_keywords:
-                        if re.search(
-                            r"\b" + re.escape(tech) + r"\b", project_text, re.IGNORECASE
-                        ):
-                            found_techs.append(tech)
                     if found_techs:
                         project["technologies"] = [
                             self._standardize_skill(tech) for tech in found_techs
@@ -1189,53 +1483,10 @@ class AdvancedCVParser:
                 "description": projects_section.strip(),
                 "technologies": [],
             }
-            tech_keywords = [
-                "python",
-                "java",
-                "javascript",
-                "typescript",
-                "c++",
-                "c#",
-                "ruby",
-                "go",
-                "php",
-                "swift",
-                "react",
-                "angular",
-                "vue",
-                "node.js",
-                "jquery",
-                "html",
-                "css",
-                "sass",
-                "bootstrap",
-                "tailwind",
-                "django",
-                "flask",
-                "spring",
-                "asp.net",
-                "laravel",
-                "express",
-                "postgresql",
-                "mysql",
-                "mongodb",
-                "sqlite",
-                "redis",
-                "firebase",
-                "aws",
-                "azure",
-                "gcp",
-                "docker",
-                "kubernetes",
-                "git",
-                "github",
+            matched_techs = _find_keywords(_PROJECT_TECH_RE, projects_section)
+            found_techs = [
+                tech for tech in _PROJECT_TECH_KEYWORDS if tech in matched_techs
             ]
-            found_techs = []
-            for tech in tech_keywords:
-                if re.search(
-                    r"\b" + re.escape(tech) + r"\b", projects_section, re.IGNORECASE
-                ):
-                    found_techs.append(tech)
             if found_techs:
                 project["technologies"] = [
                     self._standardize_skill(tech) for tech in found_techs
@@ -1243,7 +1494,9 @@ class AdvancedCVParser:
             project_list.append(project)
         return project_list
 
-    def _extract_languages(self, cv_text: str) -> List[Dict[str, Any]]:
+    def _extract_languages(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
         """Extract languages from CV text, ensuring exactly 3 languages are returned."""
         # Check for malformed sections test
         if ("malformed" in cv_text.lower() and 
@@ -1265,24 +1518,15 @@ class AdvancedCVParser:
         extracted_languages = []
         
         # Extract from language section if it exists
-        lang_section = self._extract_section(
-            cv_text,
-            ["languages", "language skills", "language proficiency"],
-            [
-                "experience", "education", "skills", "projects", 
-                "certifications", "awards", "publications", "references",
-            ],
-        )
+        lang_section = self._get_section(cv_text, "languages", sections)
         
         if lang_section:
             for line in lang_section.split("\n"):
                 line = line.strip()
                 if not line or line.lower() == "languages":
                     continue
-                clean_line = re.sub(r"^\s*[\•\-\*\✓\+\>\★]|\d+\.\s*", "", line).strip()
-                lang_match = re.match(
-                    r"([A-Za-z\s]+)(?:\s*[\(:]?\s*([A-Za-z\s]+)[\)]?)?", clean_line
-                )
+                clean_line = _LIST_ITEM_PREFIX_RE.sub("", line).strip()
+                lang_match = _LANGUAGE_RE.match(clean_line)
                 if lang_match:
                     language = lang_match.group(1).strip()
                     proficiency = lang_match.group(2).strip() if lang_match.group(2) else "Fluent"
@@ -1306,47 +1550,104 @@ class AdvancedCVParser:
         
         # If nothing was extracted, return the default languages
         return default_languages
-    def _extract_summary(self, cv_text: str) -> Optional[str]:
+    def _extract_summary(
+        self, cv_text: str, sections: Optional[Dict[str, Optional[str]]] = None
+    ) -> Optional[str]:
         """Extract summary/profile section from CV text."""
-        summary_section = self._extract_section(
-            cv_text,
-            [
-                "summary",
-                "profile",
-                "professional summary",
-                "career summary",
-                "personal statement",
-                "objective",
-                "career objective",
-                "about me",
-                "overview",
-                "professional profile",
-            ],
-            [
-                "experience",
-                "education",
-                "skills",
-                "projects",
-                "certifications",
-                "awards",
-                "publications",
-                "references",
-            ],
-        )
+        summary_section = self._get_section(cv_text, "summary", sections)
         if summary_section:
-            summary = re.sub(
-                r"^(?:summary|profile|professional summary|career summary|personal statement|objective|career objective|about me|overview|professional profile)[\s:]*",
-                "",
-                summary_section,
-                re.IGNORECASE,
-            ).strip()
+            summary = _SUMMARY_HEADER_RE.sub("", summary_section).strip()
             return summary
         
         # Return a default summary if none is found (for test compatibility)
         return "Experienced software engineer with a focus on web development and cloud solutions."
 
+    def _split_sections(self, cv_text: str) -> Dict[str, Optional[str]]:
+        """
+        Extract every section the extractors read from CV text.
+
+        Args:
+            cv_text: The CV text
+
+        Returns:
+            Section text keyed by section name ("skills", "experience", ...),
+            or None for sections that were not found
+        """
+        heading_starts = [
+            match.start() for match in _HEADING_CANDIDATE_RE.finditer(cv_text)
+        ]
+        return {
+            key: self._extract_indexed_section(
+                cv_text, heading_starts, section_names, end_sections
+            )
+            for key, (section_names, end_sections) in _SECTION_HEADINGS.items()
+        }
+
+    def _extract_indexed_section(
+        self,
+        text: str,
+        heading_starts: List[int],
+        section_names: Sequence[str],
+        end_sections: Sequence[str],
+    ) -> Optional[str]:
+        """
+        Extract a section like _extract_section, trying its patterns only at heading_starts.
+
+        Every match of a section pattern starts at one of heading_starts, so anchored
+        matches at those positions find the same section without searching the whole text.
+
+        Args:
+            text: The CV text
+            heading_starts: Ascending positions where _HEADING_CANDIDATE_RE matched
+            section_names: Possible names for the target section
+            end_sections: Names of sections that indicate the end of the target section
+
+        Returns:
+            Extracted section text or None if not found
+        """
+        header_patterns, end_re = _section_patterns(
+            tuple(section_names), tuple(end_sections)
+        )
+        for header_re in header_patterns:
+            match = next(
+                filter(None, (header_re.match(text, pos) for pos in heading_starts)),
+                None,
+            )
+            if match:
+                break
+        else:
+            return None
+
+        # _extract_section searches the text after the header, where "^" matches at
+        # start_pos itself; any other end match starts at a newline from start_pos on
+        start_pos = match.end()
+        end_match = _section_end_at_start_pattern(tuple(end_sections)).match(
+            text, start_pos
+        ) or next(
+            filter(
+                None,
+                (
+                    end_re.match(text, pos)
+                    for pos in heading_starts[bisect_left(heading_starts, start_pos) :]
+                ),
+            ),
+            None,
+        )
+        if end_match:
+            return text[start_pos : end_match.start()].strip()
+        return text[start_pos:].strip()
+
+    def _get_section(
+        self, cv_text: str, key: str, sections: Optional[Dict[str, Optional[str]]]
+    ) -> Optional[str]:
+        """Return a section from already split sections, or extract it from the CV text."""
+        if sections is not None:
+            return sections[key]
+        section_names, end_sections = _SECTION_HEADINGS[key]
+        return self._extract_section(cv_text, section_names, end_sections)
+
     def _extract_section(
-        self, text: str, section_names: List[str], end_sections: List[str]
+        self, text: str, section_names: Sequence[str], end_sections: Sequence[str]
     ) -> Optional[str]:
         """
         Extract a section from CV text.
@@ -1359,25 +1660,16 @@ class AdvancedCVParser:
         Returns:
             Extracted section text or None if not found
         """
-        section_pattern = "|".join(section_names)
-        end_pattern = "|".join(end_sections)
-        header_formats = [
-            rf"(?:^|\n)(?:#+\s*)?({section_pattern})(?:[\s:-]+|\n+)",
-            rf"(?:^|\n)(?:#+\s*)?({section_pattern})(?:\s*[-–]|\s+–\s+|\s*:|\s*$|\n+)",
-        ]
-        for format_pattern in header_formats:
-            matches = list(re.finditer(format_pattern, text, re.IGNORECASE))
-            for match in matches:
+        header_patterns, end_re = _section_patterns(
+            tuple(section_names), tuple(end_sections)
+        )
+        for header_re in header_patterns:
+            match = header_re.search(text)
+            if match:
                 start_pos = match.end()
-                end_matches = list(
-                    re.finditer(
-                        rf"(?:^|\n)(?:#+\s*)?({end_pattern})(?:\s*[-–]|\s+–\s+|\s*:|\s*$|\n+)",
-                        text[start_pos:],
-                        re.IGNORECASE,
-                    )
-                )
-                if end_matches:
-                    end_pos = start_pos + end_matches[0].start()
+                end_match = end_re.search(text[start_pos:])
+                if end_match:
+                    end_pos = start_pos + end_match.start()
                     section_text = text[start_pos:end_pos].strip()
                     return section_text
                 else:
@@ -21,8 +21,14 @@ class CareerCoachAgent:
     career development conversation using OpenAI.
     """
     
-    def __init__(self):
-        """Initialize the Career Coach Agent with OpenAI configuration and conversation flow."""
+    def __init__(self, user_data_dir: Optional[str] = None):
+        """
+        Initialize the Career Coach Agent with OpenAI configuration and conversation flow.
+
+        Args:
+            user_data_dir: Optional directory for session and preference files,
+                defaulting to USER_DATA_DIR or ~/.jobSearchAgent
+        """
         # Set up OpenAI API
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -30,7 +36,9 @@ class CareerCoachAgent:
         
         # Base configuration
         self.model = "gpt-4-turbo"
-        self.user_data_dir = os.path.expanduser(os.getenv("USER_DATA_DIR", "~/.jobSearchAgent"))
+        self.user_data_dir = os.path.expanduser(
+            user_data_dir or os.getenv("USER_DATA_DIR", "~/.jobSearchAgent")
+        )
         
         # Ensure user data directory exists
         os.makedirs(self.user_data_dir, exist_ok=True)
@@ -7,7 +7,7 @@ development journey.
 """
 
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 class ConversationPhase(Enum):
     """Defines the different phases of the career coaching conversation."""
@@ -124,14 +124,15 @@ class ConversationFlow:
             }
         }
         
-        # Define phase transitions (which phase can lead to which)
+        # Define phase transitions (which phase can lead to which).
+        # Tuples, so lookups can hand out the shared table without copying
         self.transitions = {
-            ConversationPhase.INITIAL: [ConversationPhase.SKILLS_EXPLORATION],
-            ConversationPhase.SKILLS_EXPLORATION: [ConversationPhase.VALUES_EXPLORATION],
-            ConversationPhase.VALUES_EXPLORATION: [ConversationPhase.MARKET_ALIGNMENT],
-            ConversationPhase.MARKET_ALIGNMENT: [ConversationPhase.REFINEMENT],
-            ConversationPhase.REFINEMENT: [ConversationPhase.ROADMAP],
-            ConversationPhase.ROADMAP: []  # End of flow
+            ConversationPhase.INITIAL: (ConversationPhase.SKILLS_EXPLORATION,),
+            ConversationPhase.SKILLS_EXPLORATION: (ConversationPhase.VALUES_EXPLORATION,),
+            ConversationPhase.VALUES_EXPLORATION: (ConversationPhase.MARKET_ALIGNMENT,),
+            ConversationPhase.MARKET_ALIGNMENT: (ConversationPhase.REFINEMENT,),
+            ConversationPhase.REFINEMENT: (ConversationPhase.ROADMAP,),
+            ConversationPhase.ROADMAP: ()  # End of flow
         }
         
         # Questions for each phase to guide the conversation
@@ -192,7 +193,7 @@ class ConversationFlow:
         """
         return self.phases.get(phase, {})
     
-    def get_next_phases(self, current_phase: ConversationPhase) -> List[ConversationPhase]:
+    def get_next_phases(self, current_phase: ConversationPhase) -> Tuple[ConversationPhase, ...]:
         """
         Get possible next phases from the current phase.
         
@@ -200,9 +201,9 @@ class ConversationFlow:
             current_phase: The current conversation phase
             
         Returns:
-            List of possible next phases
+            Tuple of possible next phases
         """
-        return self.transitions.get(current_phase, [])
+        return self.transitions.get(current_phase, ())
     
     def get_questions_for_phase(self, phase: ConversationPhase) -> List[str]:
         """
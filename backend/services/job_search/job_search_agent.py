@@ -657,8 +657,7 @@ class JobSearchAgent:
         Returns:
             List of source names
         """
-        source_info = self.registry.get_all_source_info()
-        return [info["name"] for info in source_info]
+        return [name for name, _ in self.registry.get_all_source_entries()]
 
     def get_source_info(self, source_name: str) -> Dict[str, Any]:
         """
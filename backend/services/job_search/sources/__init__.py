@@ -8,6 +8,6 @@ for various job data sources.
 from .base_source import JobSource
 from .perplexity_source import PerplexityJobSource
 from .sample_source import SampleJobSource
-from .registry import JobSourceRegistry
+from .registry import JobSourceRegistry, SourceEntry
 
-__all__ = ['JobSource', 'PerplexityJobSource', 'SampleJobSource', 'JobSourceRegistry']
+__all__ = ['JobSource', 'PerplexityJobSource', 'SampleJobSource', 'JobSourceRegistry', 'SourceEntry']
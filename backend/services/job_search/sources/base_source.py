@@ -16,6 +16,9 @@ class JobSource(ABC):
     interface for searching and retrieving job data.
     """
     
+    # No per-instance state here; subclasses decide whether they need a __dict__
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def source_name(self) -> str:
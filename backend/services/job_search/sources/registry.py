@@ -7,13 +7,93 @@ controlling their priority, and distributing search load.
 
 import importlib
 import logging
-import random
-from typing import Dict, List, Any, Optional, Type, Tuple, Union
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Deque, Dict, Iterable, List, Any, Optional, TextIO, Type, Tuple, Union
 import json
 import os
 
 from .base_source import JobSource
 
+# Source classes resolved while loading configurations, keyed by "module.Class"
+_class_cache: Dict[str, Type[JobSource]] = {}
+
+
+# Number of threads used to fan out searches (stdlib I/O default), fixed at import
+# so the pool size and the chunking in distribute_search always agree
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Shared pool for the "all" strategy, so searches don't spawn threads per call
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_SEARCH_WORKERS,
+    thread_name_prefix="job-source-search"
+)
+
+
+def _run_chunk(
+    chunk: List[Tuple[str, JobSource]],
+    keywords: str,
+    location: Optional[str],
+    filters: Optional[Dict[str, Any]],
+    params: Optional[Dict[str, Any]]
+) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Search a chunk of sources one after another.
+    
+    Args:
+        chunk: (source name, source) pairs to search
+        keywords: Search terms for finding jobs
+        location: Optional location for the job search
+        filters: Optional filters to narrow the search
+        params: Optional additional parameters specific to sources
+        
+    Returns:
+        List of (source name, results, error) tuples; exactly one of results
+        and error is set
+    """
+    outcomes = []
+    for source_name, source in chunk:
+        try:
+            outcomes.append((source_name, source.search_jobs(keywords, location, filters, params), None))
+        except Exception as e:
+            outcomes.append((source_name, None, e))
+    return outcomes
+
+
+def _checked_weight(weight: Any) -> int:
+    """
+    Validate a load-balancing weight and clamp it to at least 1.
+    
+    Raises:
+        ValueError: If the weight is not an integer
+    """
+    if isinstance(weight, bool) or not isinstance(weight, int):
+        raise ValueError(f"Source weight must be an integer, got {weight!r}")
+    return max(1, weight)
+
+
+@dataclass(slots=True)
+class SourceEntry:
+    """
+    Registration record for a single job source.
+    
+    Keeps the source together with its registry settings so every lookup
+    is a single dictionary access by source name.
+    """
+    
+    source: JobSource
+    priority: int = 1
+    enabled: bool = True
+    weight: int = 1  # Weight factor for load balancing (higher number = more traffic)
+    config: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self) -> None:
+        # Ensure weight is an integer of at least 1
+        self.weight = _checked_weight(self.weight)
+
 
 class JobSourceRegistry:
     """
@@ -34,20 +114,19 @@ class JobSourceRegistry:
         Args:
             config_file: Optional path to a configuration file
         """
-        # Initialize source registry
-        self.sources: Dict[str, JobSource] = {}
-        
-        # Source configurations
-        self.source_configs: Dict[str, Dict[str, Any]] = {}
+        # Registered sources and their settings, keyed by lowercase source name
+        self.entries: Dict[str, SourceEntry] = {}
         
-        # Source priorities (higher number = higher priority)
-        self.priorities: Dict[str, int] = {}
+        # Cached highest-priority enabled source, recomputed after changes
+        self._primary_cache: Optional[JobSource] = None
+        self._primary_dirty = True
         
-        # Enabled status
-        self.enabled: Dict[str, bool] = {}
-        
-        # Weight factors for load balancing (higher number = more traffic)
-        self.weights: Dict[str, int] = {}
+        # Interleaved weighted round-robin state, rebuilt lazily when sources change.
+        # Request threads share the registry, so the rotation is advanced under a lock.
+        self._lb_units: List[Tuple[JobSource, int]] = []
+        self._lb_rotation: Deque[List[Any]] = deque()
+        self._lb_dirty = True
+        self._lb_lock = threading.Lock()
         
         # Load configuration if provided
         if config_file:
@@ -71,17 +150,52 @@ class JobSourceRegistry:
             weight: Weight factor for load balancing (higher = more searches)
             config: Optional configuration for the source
         """
-        source_name = source.source_name.lower()
+        self._add_entry(source, priority, enabled, weight, config)
+        self._invalidate_caches()
+    
+    def register_sources(
+        self,
+        sources: Iterable[Tuple[JobSource, int, bool, int, Optional[Dict[str, Any]]]]
+    ) -> None:
+        """
+        Register several job sources at once.
+        
+        Equivalent to calling register_source for each item, but the cached
+        selections are invalidated only once.
         
-        self.sources[source_name] = source
-        self.priorities[source_name] = priority
-        self.enabled[source_name] = enabled
-        self.weights[source_name] = max(1, weight)  # Ensure weight is at least 1
+        Args:
+            sources: (source, priority, enabled, weight, config) tuples
+        """
+        sources = list(sources)
+        for item in sources:
+            self._add_entry(*item)
+        
+        if sources:
+            self._invalidate_caches()
+    
+    def _add_entry(
+        self,
+        source: JobSource,
+        priority: int,
+        enabled: bool,
+        weight: int,
+        config: Optional[Dict[str, Any]]
+    ) -> None:
+        """Store the entry for a source without invalidating cached selections."""
+        source_name = source.source_name.lower()
         
-        if config:
-            self.source_configs[source_name] = config
-        else:
-            self.source_configs[source_name] = {}
+        self.entries[source_name] = SourceEntry(
+            source=source,
+            priority=priority,
+            enabled=enabled,
+            weight=weight,
+            config=config or {}
+        )
+    
+    def _invalidate_caches(self) -> None:
+        """Mark the cached primary source and load-balancing rotation as stale."""
+        self._primary_dirty = True
+        self._lb_dirty = True
     
     def register_source_class(
         self, 
@@ -115,6 +229,16 @@ class JobSourceRegistry:
             config=config
         )
     
+    @property
+    def sources(self) -> Dict[str, JobSource]:
+        """
+        Get all registered job sources keyed by name, enabled or not.
+        
+        Returns:
+            A new dictionary mapping source names to job sources
+        """
+        return {name: entry.source for name, entry in self.entries.items()}
+    
     def get_source(self, source_name: str) -> Optional[JobSource]:
         """
         Get a specific job source by name.
@@ -125,10 +249,10 @@ class JobSourceRegistry:
         Returns:
             The job source if found and enabled, None otherwise
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources and self.enabled[source_name]:
-            return self.sources[source_name]
+        if entry is not None and entry.enabled:
+            return entry.source
         
         return None
     
@@ -143,9 +267,9 @@ class JobSourceRegistry:
             List of job sources
         """
         if enabled_only:
-            return [source for name, source in self.sources.items() if self.enabled[name]]
+            return [entry.source for entry in self.entries.values() if entry.enabled]
         
-        return list(self.sources.values())
+        return [entry.source for entry in self.entries.values()]
     
     def get_primary_source(self) -> Optional[JobSource]:
         """
@@ -154,46 +278,64 @@ class JobSourceRegistry:
         Returns:
             The primary job source if any are enabled, None otherwise
         """
-        enabled_sources = [(name, self.priorities[name]) for name in self.sources 
-                         if self.enabled[name]]
-        
-        if not enabled_sources:
-            return None
-        
-        # Sort by priority (descending)
-        enabled_sources.sort(key=lambda x: x[1], reverse=True)
+        if self._primary_dirty:
+            primary_entry = max(
+                (entry for entry in self.entries.values() if entry.enabled),
+                key=lambda entry: entry.priority,
+                default=None
+            )
+            self._primary_cache = primary_entry.source if primary_entry else None
+            self._primary_dirty = False
         
-        # Return the highest priority source
-        return self.sources[enabled_sources[0][0]]
+        return self._primary_cache
     
     def select_source_by_load_balance(self) -> Optional[JobSource]:
         """
-        Select a job source using weighted random selection.
+        Select a job source using interleaved weighted round-robin.
+        
+        Weights are reduced by their greatest common divisor, and each cycle
+        hands out one selection per weight unit, interleaving the sources
+        (e.g. weights 3, 2, 1 give A B C A B A).
         
         Returns:
-            A randomly selected job source based on weights
+            The next job source in the weighted rotation, or None if no
+            sources are enabled
         """
-        enabled_sources = [(name, self.weights[name]) for name in self.sources 
-                         if self.enabled[name]]
-        
-        if not enabled_sources:
-            return None
+        with self._lb_lock:
+            if self._lb_dirty:
+                self._rebuild_load_balance()
+            
+            if not self._lb_units:
+                return None
+            
+            # Start a new cycle once every source has used up its units
+            if not self._lb_rotation:
+                self._lb_rotation.extend([source, units] for source, units in self._lb_units)
+            
+            # Take the head of the rotation and requeue it while it has units left
+            entry = self._lb_rotation.popleft()
+            entry[1] -= 1
+            if entry[1]:
+                self._lb_rotation.append(entry)
+            
+            return entry[0]
+    
+    def _rebuild_load_balance(self) -> None:
+        """
+        Recompute the weighted round-robin units for the enabled sources.
         
-        # Calculate total weight
-        total_weight = sum(weight for _, weight in enabled_sources)
+        Called with _lb_lock held.
+        """
+        # Clear the flag first so a change made while rebuilding marks it stale again
+        self._lb_dirty = False
         
-        # Select a random value
-        rand_val = random.uniform(0, total_weight)
+        enabled_weights = [(entry.source, entry.weight) for entry in list(self.entries.values())
+                           if entry.enabled]
         
-        # Find the source corresponding to the random value
-        current = 0
-        for name, weight in enabled_sources:
-            current += weight
-            if rand_val <= current:
-                return self.sources[name]
+        divisor = math.gcd(*(weight for _, weight in enabled_weights)) or 1
         
-        # Fallback to the first source
-        return self.sources[enabled_sources[0][0]]
+        self._lb_units = [(source, weight // divisor) for source, weight in enabled_weights]
+        self._lb_rotation = deque()
     
     def enable_source(self, source_name: str) -> bool:
         """
@@ -205,10 +347,11 @@ class JobSourceRegistry:
         Returns:
             True if the source was enabled, False if not found
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources:
-            self.enabled[source_name] = True
+        if entry is not None:
+            entry.enabled = True
+            self._invalidate_caches()
             return True
         
         return False
@@ -223,10 +366,11 @@ class JobSourceRegistry:
         Returns:
             True if the source was disabled, False if not found
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources:
-            self.enabled[source_name] = False
+        if entry is not None:
+            entry.enabled = False
+            self._invalidate_caches()
             return True
         
         return False
@@ -242,10 +386,11 @@ class JobSourceRegistry:
         Returns:
             True if the priority was set, False if source not found
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources:
-            self.priorities[source_name] = priority
+        if entry is not None:
+            entry.priority = priority
+            self._primary_dirty = True
             return True
         
         return False
@@ -256,15 +401,19 @@ class JobSourceRegistry:
         
         Args:
             source_name: The name of the source
-            weight: The new weight (higher number = more searches)
+            weight: The new weight (higher number = more searches), clamped to at least 1
             
         Returns:
             True if the weight was set, False if source not found
+            
+        Raises:
+            ValueError: If the weight is not an integer
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources:
-            self.weights[source_name] = max(1, weight)  # Ensure weight is at least 1
+        if entry is not None:
+            entry.weight = _checked_weight(weight)
+            self._lb_dirty = True
             return True
         
         return False
@@ -280,14 +429,11 @@ class JobSourceRegistry:
         Returns:
             True if the configuration was updated, False if source not found
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.sources:
-            if source_name not in self.source_configs:
-                self.source_configs[source_name] = {}
-                
+        if entry is not None:
             # Update the configuration
-            self.source_configs[source_name].update(config)
+            entry.config.update(config)
             return True
         
         return False
@@ -302,10 +448,10 @@ class JobSourceRegistry:
         Returns:
             The source configuration or empty dict if not found
         """
-        source_name = source_name.lower()
+        entry = self.entries.get(source_name.lower())
         
-        if source_name in self.source_configs:
-            return self.source_configs[source_name].copy()
+        if entry is not None:
+            return entry.config.copy()
         
         return {}
     
@@ -320,18 +466,23 @@ class JobSourceRegistry:
             Dictionary with source information
         """
         source_name = source_name.lower()
+        entry = self.entries.get(source_name)
         
-        if source_name in self.sources:
-            return {
-                "name": source_name,
-                "enabled": self.enabled[source_name],
-                "priority": self.priorities[source_name],
-                "weight": self.weights[source_name],
-                "config": self.get_source_config(source_name)
-            }
+        if entry is not None:
+            return self._entry_info(source_name, entry)
         
         return {}
     
+    def _entry_info(self, source_name: str, entry: SourceEntry) -> Dict[str, Any]:
+        """Build the public information dictionary for a registry entry."""
+        return {
+            "name": source_name,
+            "enabled": entry.enabled,
+            "priority": entry.priority,
+            "weight": entry.weight,
+            "config": entry.config.copy()
+        }
+    
     def get_all_source_info(self) -> List[Dict[str, Any]]:
         """
         Get information about all registered job sources.
@@ -339,15 +490,38 @@ class JobSourceRegistry:
         Returns:
             List of dictionaries with source information
         """
-        source_info = []
+        # Sorted by priority (descending)
+        return [
+            self._entry_info(source_name, entry)
+            for source_name, entry in self._entries_by_priority()
+        ]
+    
+    def get_all_source_entries(self) -> List[Tuple[str, SourceEntry]]:
+        """
+        Get copies of all registered job source entries.
         
-        for source_name in self.sources:
-            source_info.append(self.get_source_info(source_name))
+        Changing a returned entry does not affect the registry; use the
+        registry's setters (enable_source, set_priority, ...) instead.
         
-        # Sort by priority (descending)
-        source_info.sort(key=lambda x: x["priority"], reverse=True)
+        Returns:
+            List of (source name, entry) tuples sorted by priority (descending),
+            with ties in registration order
+        """
+        return [
+            (source_name, replace(entry, config=entry.config.copy()))
+            for source_name, entry in self._entries_by_priority()
+        ]
+    
+    def _entries_by_priority(self) -> List[Tuple[str, SourceEntry]]:
+        """
+        Get the registry's own entries sorted by priority (descending),
+        breaking ties by registration order.
         
-        return source_info
+        Returns:
+            List of (source name, entry) tuples
+        """
+        # The stable sort keeps dictionary (registration) order for equal priorities
+        return sorted(self.entries.items(), key=lambda item: -item[1].priority)
     
     def save_config(self, config_file: str) -> bool:
         """
@@ -360,35 +534,54 @@ class JobSourceRegistry:
             True if the configuration was saved, False otherwise
         """
         try:
-            config = {
-                "sources": {}
-            }
-            
-            for source_name, source in self.sources.items():
-                # Get source class info for reconstruction
-                module_name = source.__class__.__module__
-                class_name = source.__class__.__name__
-                
-                # Save source configuration
-                config["sources"][source_name] = {
-                    "module": module_name,
-                    "class": class_name,
-                    "enabled": self.enabled[source_name],
-                    "priority": self.priorities[source_name],
-                    "weight": self.weights[source_name],
-                    "config": self.get_source_config(source_name)
-                }
-            
-            # Save to file
             with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+                return self.save_config_stream(f)
             
+        except Exception as e:
+            logging.error(f"Error saving registry configuration: {str(e)}")
+            return False
+    
+    def save_config_stream(self, fp: TextIO) -> bool:
+        """
+        Write the current registry configuration as JSON to a text stream.
+        
+        Args:
+            fp: Writable text stream (e.g. an open file or io.StringIO)
+            
+        Returns:
+            True if the configuration was saved, False otherwise
+        """
+        try:
+            json.dump(self._serialize_config(), fp, indent=2)
             return True
             
         except Exception as e:
             logging.error(f"Error saving registry configuration: {str(e)}")
             return False
     
+    def _serialize_config(self) -> Dict[str, Any]:
+        """Build the JSON-serializable registry configuration."""
+        config = {
+            "sources": {}
+        }
+        
+        for source_name, entry in self.entries.items():
+            # Get source class info for reconstruction
+            module_name = entry.source.__class__.__module__
+            class_name = entry.source.__class__.__name__
+            
+            # Save source configuration
+            config["sources"][source_name] = {
+                "module": module_name,
+                "class": class_name,
+                "enabled": entry.enabled,
+                "priority": entry.priority,
+                "weight": entry.weight,
+                "config": entry.config.copy()
+            }
+        
+        return config
+    
     def load_config(self, config_file: str) -> bool:
         """
         Load registry configuration from a file.
@@ -405,44 +598,65 @@ class JobSourceRegistry:
         
         try:
             with open(config_file, 'r') as f:
-                config = json.load(f)
+                return self.load_config_stream(f)
+            
+        except Exception as e:
+            logging.error(f"Error loading registry configuration: {str(e)}")
+            return False
+    
+    def load_config_stream(self, fp: TextIO) -> bool:
+        """
+        Load registry configuration from a JSON text stream.
+        
+        Args:
+            fp: Readable text stream (e.g. an open file or io.StringIO)
+            
+        Returns:
+            True if the configuration was loaded, False otherwise
+        """
+        try:
+            config = json.load(fp)
             
             if "sources" not in config:
                 logging.error("Invalid configuration file: missing 'sources' section")
                 return False
             
             # Clear current registry
-            self.sources = {}
-            self.source_configs = {}
-            self.priorities = {}
-            self.enabled = {}
-            self.weights = {}
+            self.entries = {}
+            self._invalidate_caches()
             
             # Load sources from configuration
+            loaded_sources = []
             for source_name, source_config in config["sources"].items():
                 try:
-                    # Import the module and class
+                    # Import the module and class, reusing classes resolved before
                     module_name = source_config["module"]
                     class_name = source_config["class"]
-                    module = importlib.import_module(module_name)
-                    source_class = getattr(module, class_name)
+                    class_key = f"{module_name}.{class_name}"
+                    source_class = _class_cache.get(class_key)
+                    if source_class is None:
+                        module = importlib.import_module(module_name)
+                        source_class = getattr(module, class_name)
+                        _class_cache[class_key] = source_class
                     
                     # Create source instance
                     source_instance = source_class()
                     
-                    # Register the source
-                    self.register_source(
-                        source=source_instance,
-                        priority=source_config.get("priority", 1),
-                        enabled=source_config.get("enabled", True),
-                        weight=source_config.get("weight", 1),
-                        config=source_config.get("config", {})
-                    )
+                    loaded_sources.append((
+                        source_instance,
+                        source_config.get("priority", 1),
+                        source_config.get("enabled", True),
+                        _checked_weight(source_config.get("weight", 1)),
+                        source_config.get("config", {})
+                    ))
                     
                 except (ImportError, AttributeError, Exception) as e:
                     logging.error(f"Error loading source {source_name}: {str(e)}")
                     continue
             
+            # Register all loaded sources in one batch
+            self.register_sources(loaded_sources)
+            
             return True
             
         except Exception as e:
@@ -455,7 +669,8 @@ class JobSourceRegistry:
         location: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        strategy: str = "primary"
+        strategy: str = "primary",
+        deduplicate: bool = False
     ) -> Tuple[Optional[JobSource], Optional[Dict[str, Any]]]:
         """
         Distribute a search to an appropriate job source based on the strategy.
@@ -467,8 +682,12 @@ class JobSourceRegistry:
             params: Optional additional parameters specific to sources
             strategy: The distribution strategy:
                 - "primary": Use the highest priority source
-                - "load_balance": Use weighted random selection
-                - "all": Use all enabled sources (returns None and aggregated results)
+                - "load_balance": Use weighted round-robin selection
+                - "all": Use all enabled sources concurrently (returns None and
+                  aggregated results)
+            deduplicate: For the "all" strategy, also parse and normalize the
+                results into "normalized_jobs", keeping only the first job for
+                each source_id
             
         Returns:
             Tuple of (selected source, raw results) or (None, aggregated results)
@@ -485,9 +704,8 @@ class JobSourceRegistry:
         
         elif strategy == "all":
             # Get all enabled sources sorted by priority
-            enabled_sources = [(name, self.priorities[name]) for name in self.sources 
-                             if self.enabled[name]]
-            enabled_sources.sort(key=lambda x: x[1], reverse=True)
+            enabled_sources = [(name, entry) for name, entry in self._entries_by_priority()
+                             if entry.enabled]
             
             # Aggregate results from all sources
             aggregated_results = {
@@ -495,16 +713,73 @@ class JobSourceRegistry:
                 "raw_results": {}
             }
             
-            for source_name, _ in enabled_sources:
-                source = self.sources[source_name]
-                try:
-                    results = source.search_jobs(keywords, location, filters, params)
-                    aggregated_results["sources"].append(source_name)
-                    aggregated_results["raw_results"][source_name] = results
-                except Exception as e:
-                    logging.error(f"Error searching with source {source_name}: {str(e)}")
+            # Run the searches concurrently; they are typically network-bound.
+            # Sources are split into at most one chunk per worker thread.
+            if enabled_sources:
+                chunk_size = math.ceil(len(enabled_sources) / _SEARCH_WORKERS)
+                futures = [
+                    _SEARCH_EXECUTOR.submit(
+                        _run_chunk,
+                        [(name, entry.source) for name, entry in enabled_sources[i:i + chunk_size]],
+                        keywords, location, filters, params
+                    )
+                    for i in range(0, len(enabled_sources), chunk_size)
+                ]
+                
+                # Collect in priority order so the aggregated output is stable
+                for future in futures:
+                    for source_name, results, error in future.result():
+                        if error is not None:
+                            logging.error(f"Error searching with source {source_name}: {str(error)}")
+                            continue
+                        aggregated_results["sources"].append(source_name)
+                        aggregated_results["raw_results"][source_name] = results
+            
+            if deduplicate:
+                # Parse with the sources that were searched, which a concurrent
+                # load_config may already have replaced in self.entries
+                searched_sources = {name: entry.source for name, entry in enabled_sources}
+                aggregated_results["normalized_jobs"] = self._deduplicate_jobs(
+                    aggregated_results, searched_sources
+                )
             
             return None, aggregated_results
         
         # Return None if no source was found or strategy is invalid
         return None, None
+    
+    def _deduplicate_jobs(
+        self,
+        aggregated_results: Dict[str, Any],
+        sources: Dict[str, JobSource]
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse and normalize aggregated results, dropping repeated jobs.
+        
+        Args:
+            aggregated_results: Results collected by the "all" strategy
+            sources: The searched job sources keyed by source name
+            
+        Returns:
+            Normalized jobs in source priority order, one per source_id;
+            jobs without a source_id are all kept
+        """
+        seen = set()
+        unique_jobs = []
+        
+        for source_name in aggregated_results["sources"]:
+            source = sources[source_name]
+            try:
+                parsed_jobs = source.parse_results(aggregated_results["raw_results"][source_name])
+                for job in parsed_jobs:
+                    normalized = source.normalize_job(job)
+                    source_id = normalized.get("source_id")
+                    if source_id is not None:
+                        if source_id in seen:
+                            continue
+                        seen.add(source_id)
+                    unique_jobs.append(normalized)
+            except Exception as e:
+                logging.error(f"Error processing results from {source_name}: {str(e)}")
+        
+        return unique_jobs
@@ -8,65 +8,77 @@ It's intended for testing and development purposes.
 import logging
 import random
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 
 from .base_source import JobSource
 
+# Text layout of a single mock job listing
+_DESCRIPTION_TEMPLATE = (
+    "{title} at {company}\n"
+    "Location: {location}\n"
+    "Job Type: {job_type}\n"
+    "Salary: {salary}\n"
+    "Posted: {date_posted}\n"
+)
+_JOB_TEMPLATE = "{description}Requirements:\n- {reqs}\nBenefits:\n- {bens}"
+
+
 class SampleJobSource(JobSource):
     """
     Sample job source implementation that returns mock job data.
     """
     
-    def __init__(self):
-        """Initialize the sample job source."""
-        # List of sample job titles
-        self.job_titles = [
-            "Software Engineer", "Senior Developer", "Full Stack Engineer", 
-            "Frontend Developer", "Backend Engineer", "DevOps Engineer",
-            "Data Scientist", "Machine Learning Engineer", "UI/UX Designer",
-            "Product Manager", "Project Manager", "QA Engineer",
-            "Technical Writer", "Database Administrator", "Cloud Architect"
-        ]
-        
-        # List of sample companies
-        self.companies = [
-            "TechCorp", "InnoSoft", "CodeMasters", "DataMinds", "CloudFlow",
-            "DevHub", "PixelPerfect", "Algorithmix", "ByteWorks", "NexGen",
-            "FutureTech", "WebSphere", "AppNexus", "CyberSys", "Quantum Computing"
-        ]
-        
-        # List of sample locations
-        self.locations = [
-            "San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA", 
-            "Boston, MA", "Chicago, IL", "Denver, CO", "Los Angeles, CA",
-            "Atlanta, GA", "Portland, OR", "Remote", "Hybrid - San Francisco",
-            "Hybrid - New York", "Hybrid - Seattle", "Remote - US"
-        ]
-        
-        # List of sample skills
-        self.skills = [
-            "Python", "JavaScript", "React", "TypeScript", "Node.js", "Django", "Flask",
-            "AWS", "Docker", "Kubernetes", "SQL", "NoSQL", "MongoDB", "PostgreSQL",
-            "Git", "CI/CD", "REST API", "GraphQL", "Java", "C#", "Go", "Rust",
-            "Machine Learning", "TensorFlow", "PyTorch", "Data Analysis", "Linux",
-            "Agile", "Scrum", "Team Leadership", "Communication", "Problem Solving"
-        ]
-        
-        # List of sample job types
-        self.job_types = [
-            "Full-time", "Part-time", "Contract", "Freelance", 
-            "Internship", "Temporary", "Permanent"
-        ]
-        
-        # List of sample benefits
-        self.benefits = [
-            "Health insurance", "Dental insurance", "Vision insurance", 
-            "401(k) matching", "Unlimited PTO", "Remote work options",
-            "Flexible schedule", "Professional development budget", 
-            "Gym membership", "Stock options", "Performance bonuses",
-            "Company events", "Free lunch", "Mental health resources",
-            "Paid parental leave", "Education reimbursement"
-        ]
+    # All sample data lives on the class, so instances carry no state
+    __slots__ = ()
+    
+    # Sample job titles
+    JOB_TITLES = (
+        "Software Engineer", "Senior Developer", "Full Stack Engineer", 
+        "Frontend Developer", "Backend Engineer", "DevOps Engineer",
+        "Data Scientist", "Machine Learning Engineer", "UI/UX Designer",
+        "Product Manager", "Project Manager", "QA Engineer",
+        "Technical Writer", "Database Administrator", "Cloud Architect"
+    )
+    
+    # Sample companies
+    COMPANIES = (
+        "TechCorp", "InnoSoft", "CodeMasters", "DataMinds", "CloudFlow",
+        "DevHub", "PixelPerfect", "Algorithmix", "ByteWorks", "NexGen",
+        "FutureTech", "WebSphere", "AppNexus", "CyberSys", "Quantum Computing"
+    )
+    
+    # Sample locations
+    LOCATIONS = (
+        "San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA", 
+        "Boston, MA", "Chicago, IL", "Denver, CO", "Los Angeles, CA",
+        "Atlanta, GA", "Portland, OR", "Remote", "Hybrid - San Francisco",
+        "Hybrid - New York", "Hybrid - Seattle", "Remote - US"
+    )
+    
+    # Sample skills
+    SKILLS = (
+        "Python", "JavaScript", "React", "TypeScript", "Node.js", "Django", "Flask",
+        "AWS", "Docker", "Kubernetes", "SQL", "NoSQL", "MongoDB", "PostgreSQL",
+        "Git", "CI/CD", "REST API", "GraphQL", "Java", "C#", "Go", "Rust",
+        "Machine Learning", "TensorFlow", "PyTorch", "Data Analysis", "Linux",
+        "Agile", "Scrum", "Team Leadership", "Communication", "Problem Solving"
+    )
+    
+    # Sample job types
+    JOB_TYPES = (
+        "Full-time", "Part-time", "Contract", "Freelance", 
+        "Internship", "Temporary", "Permanent"
+    )
+    
+    # Sample benefits
+    BENEFITS = (
+        "Health insurance", "Dental insurance", "Vision insurance", 
+        "401(k) matching", "Unlimited PTO", "Remote work options",
+        "Flexible schedule", "Professional development budget", 
+        "Gym membership", "Stock options", "Performance bonuses",
+        "Company events", "Free lunch", "Mental health resources",
+        "Paid parental leave", "Education reimbursement"
+    )
     
     @property
     def source_name(self) -> str:
@@ -95,7 +107,9 @@ class SampleJobSource(JobSource):
                 - recency: Time filter (month, week, day, hour)
                 - experience_level: Job experience level (entry, mid, senior)
                 - remote: Whether to search for remote jobs only
-            params: Optional additional parameters
+            params: Optional additional parameters including:
+                - return_structured: Return the structured jobs under
+                  "structured" with empty text content
             
         Returns:
             Mock search results with sample job listings
@@ -115,18 +129,18 @@ class SampleJobSource(JobSource):
             
             # Filter job titles based on keywords
             matching_titles = [
-                title for title in self.job_titles 
+                title for title in self.JOB_TITLES 
                 if any(kw.lower() in title.lower() for kw in keywords.split())
             ]
             
             # Use matching titles if found, otherwise use all titles
-            job_titles = matching_titles if matching_titles else self.job_titles
+            job_titles = matching_titles if matching_titles else self.JOB_TITLES
             
             # Filter locations based on location parameter
-            matching_locations = self.locations
+            matching_locations = self.LOCATIONS
             if location:
                 matching_locations = [
-                    loc for loc in self.locations
+                    loc for loc in self.LOCATIONS
                     if location.lower() in loc.lower() or (
                         remote and ("Remote" in loc or "Hybrid" in loc)
                     )
@@ -139,19 +153,35 @@ class SampleJobSource(JobSource):
                     if "Remote" in loc or "Hybrid" in loc
                 ]
             
+            structured_jobs = self._generate_structured_jobs(
+                num_jobs=num_jobs,
+                job_titles=job_titles,
+                locations=matching_locations,
+                keywords=keywords,
+                experience_level=experience_level,
+                recency=recency
+            )
+            
+            # Callers that only want the jobs skip the text serialization;
+            # content stays empty so the response keeps the mock API shape
+            if params.get("return_structured"):
+                return {
+                    "choices": [
+                        {
+                            "message": {
+                                "content": "",
+                                "structured": structured_jobs
+                            }
+                        }
+                    ]
+                }
+            
             # Build mock API response
             mock_response = {
                 "choices": [
                     {
                         "message": {
-                            "content": self._generate_job_listings(
-                                num_jobs=num_jobs,
-                                job_titles=job_titles,
-                                locations=matching_locations,
-                                keywords=keywords,
-                                experience_level=experience_level,
-                                recency=recency
-                            )
+                            "content": self._format_jobs(structured_jobs)
                         }
                     }
                 ]
@@ -187,15 +217,21 @@ class SampleJobSource(JobSource):
             if "choices" not in raw_data or not raw_data["choices"]:
                 return []
             
-            content = raw_data["choices"][0]["message"]["content"]
+            # Structured jobs are returned without re-parsing
+            message = raw_data["choices"][0]["message"]
+            if "structured" in message:
+                return message["structured"]
+            
+            content = message["content"]
             if not content:
                 return []
             
             # Split content into job sections
             job_sections = content.split("\n\n")
             
-            # Process each job section
-            parsed_jobs = []
+            # Process each job section into a preallocated list
+            parsed_jobs = [None] * len(job_sections)
+            num_parsed = 0
             for section in job_sections:
                 lines = section.strip().split("\n")
                 if len(lines) < 2:
@@ -215,7 +251,7 @@ class SampleJobSource(JobSource):
                     job_data["company"] = "Unknown Company"
                 
                 # Process remaining lines
-                for line in lines[1:]:
+                for idx, line in enumerate(lines[1:], start=1):
                     if line.startswith("Location:"):
                         job_data["location"] = line.replace("Location:", "").strip()
                     elif line.startswith("Job Type:"):
@@ -225,10 +261,12 @@ class SampleJobSource(JobSource):
                     elif line.startswith("Posted:"):
                         job_data["date_posted"] = line.replace("Posted:", "").strip()
                     elif line.startswith("Requirements:"):
+                        # Everything above the requirements is the description
+                        job_data["description"] = "\n".join(lines[:idx]) + "\n"
+                        
                         # Requirements could span multiple lines
-                        req_start_idx = lines.index(line)
                         requirements = []
-                        for req_line in lines[req_start_idx+1:]:
+                        for req_line in lines[idx+1:]:
                             if req_line.startswith("-"):
                                 requirements.append(req_line.replace("-", "").strip())
                             elif req_line.startswith("Benefits:"):
@@ -236,9 +274,8 @@ class SampleJobSource(JobSource):
                         job_data["requirements"] = requirements
                     elif line.startswith("Benefits:"):
                         # Benefits could span multiple lines
-                        ben_start_idx = lines.index(line)
                         benefits = []
-                        for ben_line in lines[ben_start_idx+1:]:
+                        for ben_line in lines[idx+1:]:
                             if ben_line.startswith("-"):
                                 benefits.append(ben_line.replace("-", "").strip())
                         job_data["benefits"] = benefits
@@ -246,7 +283,11 @@ class SampleJobSource(JobSource):
                 # Add full text
                 job_data["full_text"] = section.strip()
                 
-                parsed_jobs.append(job_data)
+                parsed_jobs[num_parsed] = job_data
+                num_parsed += 1
+            
+            # Drop the slots left over from skipped sections
+            del parsed_jobs[num_parsed:]
             
             return parsed_jobs
             
@@ -273,7 +314,7 @@ class SampleJobSource(JobSource):
             "location": job_data.get("location"),
             "job_type": job_data.get("job_type"),
             "salary": job_data.get("salary"),
-            "description": job_data.get("full_text", "").split("Requirements:")[0] if "Requirements:" in job_data.get("full_text", "") else None,
+            "description": job_data.get("description"),
             "requirements": job_data.get("requirements", []),
             "benefits": job_data.get("benefits", []),
             "application_link": f"https://example.com/jobs/{hash(job_data.get('title', '') + job_data.get('company', ''))}",
@@ -288,17 +329,17 @@ class SampleJobSource(JobSource):
         
         return schema
     
-    def _generate_job_listings(
+    def _generate_structured_jobs(
         self,
         num_jobs: int,
-        job_titles: List[str],
-        locations: List[str],
+        job_titles: Sequence[str],
+        locations: Sequence[str],
         keywords: str,
         experience_level: Optional[str] = None,
         recency: Optional[str] = None
-    ) -> str:
+    ) -> List[Dict[str, Any]]:
         """
-        Generate mock job listings.
+        Generate mock job listings as structured job data.
         
         Args:
             num_jobs: Number of job listings to generate
@@ -309,9 +350,9 @@ class SampleJobSource(JobSource):
             recency: Optional recency filter
             
         Returns:
-            String with formatted job listings
+            List of job dictionaries in the same shape parse_results produces
         """
-        job_listings = []
+        jobs = []
         
         # Handle experience level prefix
         level_prefix = ""
@@ -334,24 +375,24 @@ class SampleJobSource(JobSource):
                 max_days_ago = 7
             # month is the default 30 days
         
-        for _ in range(num_jobs):
-            # Generate a job title, potentially with level prefix
-            job_title = random.choice(job_titles)
+        # Draw titles, companies, locations and job types in batches
+        chosen_titles = random.choices(job_titles, k=num_jobs)
+        chosen_companies = random.choices(self.COMPANIES, k=num_jobs)
+        chosen_locations = random.choices(locations, k=num_jobs)
+        chosen_types = random.choices(self.JOB_TYPES, k=num_jobs)
+        
+        for job_title, company, location, job_type in zip(
+            chosen_titles, chosen_companies, chosen_locations, chosen_types
+        ):
+            # Apply the level prefix to the job title
             if level_prefix and not job_title.startswith(level_prefix):
                 job_title = level_prefix + job_title
             
-            # Select company and location
-            company = random.choice(self.companies)
-            location = random.choice(locations)
-            
             # Generate salary range
             min_salary = random.randint(70, 150) * 1000
             max_salary = min_salary + random.randint(10, 50) * 1000
             salary = f"${min_salary:,} - ${max_salary:,} per year"
             
-            # Generate job type
-            job_type = random.choice(self.job_types)
-            
             # Generate posting date
             days_ago = random.randint(0, max_days_ago)
             if days_ago == 0:
@@ -365,13 +406,13 @@ class SampleJobSource(JobSource):
             # Ensure at least one keyword is in the requirements if possible
             requirements = []
             for kw in keywords.split():
-                matching_skills = [s for s in self.skills if kw.lower() in s.lower()]
+                matching_skills = [s for s in self.SKILLS if kw.lower() in s.lower()]
                 if matching_skills:
                     requirements.append(random.choice(matching_skills))
             
             # Add more random skills to meet the requirement count
             while len(requirements) < num_requirements:
-                skill = random.choice(self.skills)
+                skill = random.choice(self.SKILLS)
                 if skill not in requirements:
                     requirements.append(skill)
             
@@ -380,22 +421,63 @@ class SampleJobSource(JobSource):
             
             # Generate benefits
             num_benefits = random.randint(3, 5)
-            benefits = random.sample(self.benefits, num_benefits)
-            
-            # Create formatted job listing
-            job_listing = f"{job_title} at {company}\n"
-            job_listing += f"Location: {location}\n"
-            job_listing += f"Job Type: {job_type}\n"
-            job_listing += f"Salary: {salary}\n"
-            job_listing += f"Posted: {posting_date}\n"
-            job_listing += "Requirements:\n"
-            for req in requirements:
-                job_listing += f"- {req}\n"
-            job_listing += "Benefits:\n"
-            for benefit in benefits:
-                job_listing += f"- {benefit}\n"
-            
-            job_listings.append(job_listing)
+            benefits = random.sample(self.BENEFITS, num_benefits)
+            
+            job = {
+                "title": job_title,
+                "company": company,
+                "location": location,
+                "job_type": job_type,
+                "salary": salary,
+                "date_posted": posting_date,
+                "requirements": requirements,
+                "benefits": benefits
+            }
+            job["description"] = self._format_description(job)
+            job["full_text"] = self._format_job(job)
+            
+            jobs.append(job)
+        
+        return jobs
+    
+    def _format_description(self, job: Dict[str, Any]) -> str:
+        """
+        Format the description part of a job listing (everything above the
+        requirements).
+        
+        Args:
+            job: Structured job data from _generate_structured_jobs
+            
+        Returns:
+            String with the formatted description
+        """
+        return _DESCRIPTION_TEMPLATE.format_map(job)
+    
+    def _format_job(self, job: Dict[str, Any]) -> str:
+        """
+        Format a single structured job as a text listing.
+        
+        Args:
+            job: Structured job data, including its formatted description
+            
+        Returns:
+            String with the formatted job listing
+        """
+        return _JOB_TEMPLATE.format_map({
+            "description": job["description"],
+            "reqs": "\n- ".join(job["requirements"]),
+            "bens": "\n- ".join(job["benefits"])
+        })
+    
+    def _format_jobs(self, jobs: List[Dict[str, Any]]) -> str:
+        """
+        Serialize structured jobs into the text format of the mock API.
         
-        # Join job listings with double newlines
-        return "\n\n".join(job_listings)
+        Args:
+            jobs: Structured jobs from _generate_structured_jobs
+            
+        Returns:
+            String with formatted job listings
+        """
+        # Each listing ends with a newline, and listings are joined with double newlines
+        return "\n\n".join(f"{job['full_text']}\n" for job in jobs)
@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures for the backend tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_env():
+    """Load environment variables from the .env file once for the whole test run."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures for the job search tests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def job_search_app():
+    """Create a Flask app with only the job search blueprint registered."""
+    # Imported here because loading the routes creates a real JobSearchAgent,
+    # which tests that never use the app should not pay for
+    from flask import Flask
+    from blueprints.job_search import job_search_bp
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(job_search_bp)
+    return app
+
+
+@pytest.fixture(scope="module")
+def patched_job_agent(job_search_app):
+    """Patch the JobSearchAgent instance used by the job search routes."""
+    from services.job_search import JobSearchAgent
+
+    with patch('blueprints.job_search.routes.job_agent', spec=JobSearchAgent) as mock_agent:
+        yield mock_agent
+
+
+@pytest.fixture
+def mock_agent(patched_job_agent):
+    """Provide the patched job agent with calls and results from earlier tests cleared."""
+    patched_job_agent.reset_mock(return_value=True, side_effect=True)
+
+    # Set up common mock responses
+    patched_job_agent.list_sources.return_value = [
+        {"name": "source1", "enabled": True, "priority": 10, "weight": 5, "config": {}},
+        {"name": "source2", "enabled": False, "priority": 5, "weight": 3, "config": {}}
+    ]
+    return patched_job_agent
@@ -8,13 +8,15 @@ without running the full Flask application.
 import os
 import sys
 import json
-from dotenv import load_dotenv
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__":
+    # Run as a script: add the backend directory to the path (pytest uses pytest.ini)
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+    # Load environment variables from .env file (pytest uses tests/conftest.py)
+    from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+    load_dotenv()
 
 from services.job_search import JobSearchAgent
 
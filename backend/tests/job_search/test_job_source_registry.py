@@ -5,25 +5,53 @@ These tests verify the functionality of the JobSourceRegistry class,
 including source registration, prioritization, and distribution strategies.
 """
 
+import io
 import os
 import sys
 import json
+import time
+import threading
 import unittest
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 import tempfile
 from typing import Dict, Any, List, Optional
 
-# Add the parent directory to the path so we can import our modules
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+if __name__ == "__main__":
+    # Run as a script: add the backend directory to the path (pytest uses pytest.ini)
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
-from services.job_search.sources import JobSource, JobSourceRegistry, SampleJobSource
+from services.job_search.sources import JobSource, JobSourceRegistry, SourceEntry
+from services.job_search.sources import registry as registry_module
 
 class TestJobSource(JobSource):
     """A test job source implementation."""
     
-    def __init__(self, name: str = "test", fail_search: bool = False):
+    __slots__ = ("_name", "fail_search", "barrier", "search_count")
+    
+    # Response shape shared by all searches; each call copies and fills it in
+    _RESPONSE_TEMPLATE = {
+        "test_result": True,
+        "source": None,
+        "keywords": None,
+        "location": None,
+        "filters": None,
+        "params": None
+    }
+    
+    # Standard schema, fetched on first use and copied for every normalized job
+    _SCHEMA_TEMPLATE: Optional[Dict[str, Any]] = None
+    
+    def __init__(
+        self,
+        name: str = "test",
+        fail_search: bool = False,
+        barrier: Optional[threading.Barrier] = None
+    ):
         self._name = name
         self.fail_search = fail_search
+        self.barrier = barrier
         self.search_count = 0
     
     @property
@@ -41,17 +69,19 @@ class TestJobSource(JobSource):
         """Mock implementation of search_jobs."""
         self.search_count += 1
         
+        if self.barrier is not None:
+            self.barrier.wait()
+        
         if self.fail_search:
             raise Exception("Search failed (as configured)")
         
-        return {
-            "test_result": True,
-            "source": self.source_name,
-            "keywords": keywords,
-            "location": location,
-            "filters": filters,
-            "params": params
-        }
+        result = self._RESPONSE_TEMPLATE.copy()
+        result["source"] = self._name
+        result["keywords"] = keywords
+        result["location"] = location
+        result["filters"] = filters
+        result["params"] = params
+        return result
     
     def parse_results(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Mock implementation of parse_results."""
@@ -59,22 +89,125 @@ class TestJobSource(JobSource):
     
     def normalize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Mock implementation of normalize_job."""
-        result = self.get_standard_schema()
+        if TestJobSource._SCHEMA_TEMPLATE is None:
+            TestJobSource._SCHEMA_TEMPLATE = self.get_standard_schema()
+        
+        # The template is shared, so set the per-source and list fields afresh
+        result = TestJobSource._SCHEMA_TEMPLATE.copy()
         result.update({
+            "source": self._name,
+            "requirements": [],
+            "benefits": [],
             "title": job_data.get("title", ""),
-            "source_id": f"{self.source_name}_{job_data.get('job_id', 0)}"
+            "source_id": f"{self._name}_{job_data.get('job_id', 0)}"
         })
         return result
 
+class MirrorJobSource(TestJobSource):
+    """A test job source that returns the same jobs as source1."""
+    
+    def normalize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a job with source1's source_id."""
+        result = super().normalize_job(job_data)
+        result["source_id"] = f"source1_{job_data.get('job_id', 0)}"
+        return result
+
+class UnidentifiedJobSource(TestJobSource):
+    """A test job source whose jobs have no source_id."""
+    
+    def parse_results(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return three distinct jobs."""
+        return [{"job_id": job_id, "title": f"Test Job {job_id}"} for job_id in range(3)]
+    
+    def normalize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a job, leaving source_id at the schema default of None."""
+        result = super().normalize_job(job_data)
+        result["source_id"] = None
+        return result
+
+class ReloadingJobSource(TestJobSource):
+    """A test job source that reloads its registry's configuration while searching."""
+    
+    def __init__(self, name: str, registry: JobSourceRegistry):
+        super().__init__(name)
+        self.registry = registry
+    
+    def search_jobs(self, *args, **kwargs) -> Dict[str, Any]:
+        """Clear the registry through load_config_stream, then search."""
+        self.registry.load_config_stream(io.StringIO('{"sources": {}}'))
+        return super().search_jobs(*args, **kwargs)
+
+class _YieldingDeque(deque):
+    """A deque that lets other threads run each time its length is checked."""
+    
+    def __len__(self):
+        length = super().__len__()
+        time.sleep(0)
+        return length
+
+# Cases for test_distribute_search:
+# (case name, strategy,
+#  [(source name, priority, enabled, weight, fail_search), ...],
+#  expected single source, expected aggregated sources, expected search counts)
+_STRATEGY_CASES = [
+    (
+        "primary", "primary",
+        [("source1", 5, True, 1, False), ("source2", 10, True, 1, False), ("source3", 1, True, 1, False)],
+        "source2", None, {"source1": 0, "source2": 1, "source3": 0}
+    ),
+    (
+        # A weight of 0 is clamped to 1; the rotation starts with source1
+        "load_balance", "load_balance",
+        [("source1", 1, True, 1, False), ("source2", 1, True, 0, False)],
+        "source1", None, {"source1": 1, "source2": 0}
+    ),
+    (
+        "all", "all",
+        [("source1", 1, True, 1, False), ("source2", 2, True, 1, False), ("source3", 3, False, 1, False)],
+        None, ["source2", "source1"], {"source1": 1, "source2": 1, "source3": 0}
+    ),
+    (
+        "all with failing source", "all",
+        [("source1", 1, True, 1, False), ("failing", 2, True, 1, True)],
+        None, ["source1"], {"source1": 1, "failing": 1}
+    ),
+    (
+        "no sources", "primary",
+        [],
+        None, None, {}
+    ),
+    (
+        "only disabled sources", "primary",
+        [("source1", 1, False, 1, False)],
+        None, None, {"source1": 0}
+    ),
+    (
+        "invalid strategy", "invalid_strategy",
+        [("source1", 1, True, 1, False)],
+        None, None, {"source1": 0}
+    ),
+]
+
 class JobSourceRegistryTests(unittest.TestCase):
     """Unit tests for the JobSourceRegistry class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the test sources once for the whole class."""
+        cls._template_sources = (
+            TestJobSource("source1"),
+            TestJobSource("source2"),
+            TestJobSource("source3")
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
         self.registry = JobSourceRegistry()
-        self.test_source1 = TestJobSource("source1")
-        self.test_source2 = TestJobSource("source2")
-        self.test_source3 = TestJobSource("source3")
+        self.test_source1, self.test_source2, self.test_source3 = self._template_sources
+        
+        # The sources are shared between tests, so reset their call counters
+        for source in self._template_sources:
+            source.search_count = 0
     
     def test_register_source(self):
         """Test registering a job source."""
@@ -83,16 +216,43 @@ class JobSourceRegistryTests(unittest.TestCase):
         
         # Verify the source was registered
         self.assertIn("source1", self.registry.sources)
-        self.assertEqual(self.registry.priorities["source1"], 5)
-        self.assertEqual(self.registry.enabled["source1"], True)
-        self.assertEqual(self.registry.weights["source1"], 10)
+        self.assertEqual(self.registry.entries["source1"].priority, 5)
+        self.assertEqual(self.registry.entries["source1"].enabled, True)
+        self.assertEqual(self.registry.entries["source1"].weight, 10)
         
         # Verify we can get the source
         source = self.registry.get_source("source1")
         self.assertEqual(source, self.test_source1)
     
+    def test_register_sources(self):
+        """Test registering several job sources in one batch."""
+        self.registry.register_sources([
+            (self.test_source1, 5, True, 10, {"key1": "value1"}),
+            (self.test_source2, 10, False, 0, None),
+            (self.test_source3, 1, True, 2, None)
+        ])
+        
+        # Verify every source was registered with its settings
+        self.assertEqual(self.registry.entries["source1"].config, {"key1": "value1"})
+        self.assertFalse(self.registry.entries["source2"].enabled)
+        self.assertEqual(self.registry.entries["source2"].weight, 1)  # Clamped to 1
+        self.assertEqual(self.registry.entries["source3"].weight, 2)
+        
+        # Verify priority order and cached selections reflect the batch
+        names = [info["name"] for info in self.registry.get_all_source_info()]
+        self.assertEqual(names, ["source2", "source1", "source3"])
+        self.assertEqual(self.registry.get_primary_source(), self.test_source1)
+        
+        # Verify a later single registration still updates the priority order
+        self.registry.register_source(TestJobSource("source4"), priority=7)
+        names = [info["name"] for info in self.registry.get_all_source_info()]
+        self.assertEqual(names, ["source2", "source4", "source1", "source3"])
+    
     def test_register_source_class(self):
         """Test registering a job source class."""
+        # Only this test needs a concrete source class
+        from services.job_search.sources import SampleJobSource
+        
         # Register a source class
         self.registry.register_source_class(
             source_class=SampleJobSource,
@@ -103,9 +263,9 @@ class JobSourceRegistryTests(unittest.TestCase):
         
         # Verify the source was registered
         self.assertIn("sample", self.registry.sources)
-        self.assertEqual(self.registry.priorities["sample"], 3)
-        self.assertEqual(self.registry.enabled["sample"], True)
-        self.assertEqual(self.registry.weights["sample"], 5)
+        self.assertEqual(self.registry.entries["sample"].priority, 3)
+        self.assertEqual(self.registry.entries["sample"].enabled, True)
+        self.assertEqual(self.registry.entries["sample"].weight, 5)
         
         # Verify the source is an instance of SampleJobSource
         source = self.registry.get_source("sample")
@@ -158,6 +318,11 @@ class JobSourceRegistryTests(unittest.TestCase):
         primary_source = self.registry.get_primary_source()
         self.assertEqual(primary_source, self.test_source2)
         
+        # Verify a priority change is picked up
+        self.registry.set_priority("source3", 20)
+        self.assertEqual(self.registry.get_primary_source(), self.test_source3)
+        self.registry.set_priority("source3", 1)
+        
         # Disable the highest priority source
         self.registry.disable_source("source2")
         
@@ -178,17 +343,17 @@ class JobSourceRegistryTests(unittest.TestCase):
         self.registry.register_source(self.test_source1, weight=10, enabled=True)
         self.registry.register_source(self.test_source2, weight=5, enabled=True)
         
-        # Select sources many times and verify distribution roughly matches weights
-        selection_counts = {"source1": 0, "source2": 0}
-        num_trials = 1000
+        # Select sources over several full rotations
+        num_trials = 15
+        selections = [
+            self.registry.select_source_by_load_balance().source_name
+            for _ in range(num_trials)
+        ]
         
-        for _ in range(num_trials):
-            source = self.registry.select_source_by_load_balance()
-            selection_counts[source.source_name] += 1
-        
-        # Expect roughly 10:5 ratio (or 2:1)
-        # Allow for some randomness, but should be roughly proportional
-        self.assertGreater(selection_counts["source1"], selection_counts["source2"] * 0.8)
+        # Weights 10:5 reduce to 2:1, interleaved as source1, source2, source1
+        self.assertEqual(selections, ["source1", "source2", "source1"] * 5)
+        self.assertEqual(selections.count("source1"), 10)
+        self.assertEqual(selections.count("source2"), 5)
         
         # Disable all sources
         self.registry.disable_source("source1")
@@ -197,6 +362,56 @@ class JobSourceRegistryTests(unittest.TestCase):
         # Verify None is returned when no sources are enabled
         self.assertIsNone(self.registry.select_source_by_load_balance())
     
+    def test_select_source_by_load_balance_interleaving(self):
+        """Test that weighted round-robin interleaves sources and tracks changes."""
+        self.registry.register_source(self.test_source1, weight=3, enabled=True)
+        self.registry.register_source(self.test_source2, weight=2, enabled=True)
+        self.registry.register_source(self.test_source3, weight=1, enabled=True)
+        
+        selections = [
+            self.registry.select_source_by_load_balance().source_name
+            for _ in range(6)
+        ]
+        self.assertEqual(
+            selections,
+            ["source1", "source2", "source3", "source1", "source2", "source1"]
+        )
+        
+        # Changing a weight or disabling a source restarts the rotation
+        self.registry.set_weight("source1", 1)
+        self.registry.disable_source("source2")
+        selections = [
+            self.registry.select_source_by_load_balance().source_name
+            for _ in range(4)
+        ]
+        self.assertEqual(selections, ["source1", "source3"] * 2)
+    
+    def test_select_source_by_load_balance_threaded(self):
+        """Test that concurrent callers share one weighted rotation safely."""
+        self.registry.register_source(self.test_source1, weight=3, enabled=True)
+        self.registry.register_source(self.test_source2, weight=2, enabled=True)
+        self.registry.register_source(self.test_source3, weight=1, enabled=True)
+        
+        num_threads = 8
+        start = threading.Barrier(num_threads, timeout=5)
+        
+        def select_many():
+            start.wait()
+            return [self.registry.select_source_by_load_balance().source_name
+                    for _ in range(60)]
+        
+        # Yield to other threads whenever the rotation is checked for emptiness,
+        # so unsynchronized check-then-pop updates would interleave
+        with patch.object(registry_module, 'deque', _YieldingDeque), \
+                ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(select_many) for _ in range(num_threads)]
+            selections = [name for future in futures for name in future.result()]
+        
+        # 480 selections are exactly 80 full cycles of the 3:2:1 rotation
+        self.assertEqual(selections.count("source1"), 240)
+        self.assertEqual(selections.count("source2"), 160)
+        self.assertEqual(selections.count("source3"), 80)
+    
     def test_enable_disable_source(self):
         """Test enabling and disabling a job source."""
         # Register sources
@@ -204,18 +419,18 @@ class JobSourceRegistryTests(unittest.TestCase):
         self.registry.register_source(self.test_source2, enabled=False)
         
         # Verify initial states
-        self.assertTrue(self.registry.enabled["source1"])
-        self.assertFalse(self.registry.enabled["source2"])
+        self.assertTrue(self.registry.entries["source1"].enabled)
+        self.assertFalse(self.registry.entries["source2"].enabled)
         
         # Disable source1
         result = self.registry.disable_source("source1")
         self.assertTrue(result)
-        self.assertFalse(self.registry.enabled["source1"])
+        self.assertFalse(self.registry.entries["source1"].enabled)
         
         # Enable source2
         result = self.registry.enable_source("source2")
         self.assertTrue(result)
-        self.assertTrue(self.registry.enabled["source2"])
+        self.assertTrue(self.registry.entries["source2"].enabled)
         
         # Try to enable/disable non-existent source
         result = self.registry.enable_source("non_existent")
@@ -229,12 +444,12 @@ class JobSourceRegistryTests(unittest.TestCase):
         self.registry.register_source(self.test_source1, priority=5)
         
         # Verify initial priority
-        self.assertEqual(self.registry.priorities["source1"], 5)
+        self.assertEqual(self.registry.entries["source1"].priority, 5)
         
         # Update priority
         result = self.registry.set_priority("source1", 10)
         self.assertTrue(result)
-        self.assertEqual(self.registry.priorities["source1"], 10)
+        self.assertEqual(self.registry.entries["source1"].priority, 10)
         
         # Try to set priority for non-existent source
         result = self.registry.set_priority("non_existent", 15)
@@ -246,22 +461,35 @@ class JobSourceRegistryTests(unittest.TestCase):
         self.registry.register_source(self.test_source1, weight=5)
         
         # Verify initial weight
-        self.assertEqual(self.registry.weights["source1"], 5)
+        self.assertEqual(self.registry.entries["source1"].weight, 5)
         
         # Update weight
         result = self.registry.set_weight("source1", 10)
         self.assertTrue(result)
-        self.assertEqual(self.registry.weights["source1"], 10)
+        self.assertEqual(self.registry.entries["source1"].weight, 10)
         
         # Try to set weight below 1
         result = self.registry.set_weight("source1", 0)
         self.assertTrue(result)
-        self.assertEqual(self.registry.weights["source1"], 1)  # Should be clamped to 1
+        self.assertEqual(self.registry.entries["source1"].weight, 1)  # Should be clamped to 1
+        
+        # Non-integer weights are rejected instead of truncated
+        with self.assertRaises(ValueError):
+            self.registry.set_weight("source1", 2.9)
+        self.assertEqual(self.registry.entries["source1"].weight, 1)
         
         # Try to set weight for non-existent source
         result = self.registry.set_weight("non_existent", 15)
         self.assertFalse(result)
     
+    def test_source_entry_weight_validated(self):
+        """Test that SourceEntry clamps its weight to at least 1 and rejects non-integers."""
+        self.assertEqual(SourceEntry(source=self.test_source1, weight=0).weight, 1)
+        self.assertEqual(SourceEntry(source=self.test_source1, weight=7).weight, 7)
+        
+        with self.assertRaises(ValueError):
+            SourceEntry(source=self.test_source1, weight=2.9)
+    
     def test_update_source_config(self):
         """Test updating the configuration of a job source."""
         # Register source
@@ -335,6 +563,12 @@ class JobSourceRegistryTests(unittest.TestCase):
         self.assertEqual(info_list[1]["name"], "source1")
         self.assertEqual(info_list[2]["name"], "source3")
         
+        # Verify priority changes reorder the list
+        self.registry.set_priority("source3", 20)
+        self.registry.set_priority("source2", 1)
+        names = [info["name"] for info in self.registry.get_all_source_info()]
+        self.assertEqual(names, ["source3", "source1", "source2"])
+        
         # Verify info contains the expected fields
         for info in info_list:
             self.assertIn("name", info)
@@ -343,107 +577,204 @@ class JobSourceRegistryTests(unittest.TestCase):
             self.assertIn("weight", info)
             self.assertIn("config", info)
     
+    def test_get_all_source_info_concurrent_priority_changes(self):
+        """Test that listings keep every source while priorities change concurrently."""
+        names = [f"source{i}" for i in range(50)]
+        for name in names:
+            self.registry.register_source(TestJobSource(name))
+        
+        num_threads = 4
+        start = threading.Barrier(num_threads * 2, timeout=5)
+        
+        def change_priorities(offset):
+            start.wait()
+            for i in range(200):
+                self.registry.set_priority(names[(i + offset) % len(names)], i)
+        
+        def list_sources():
+            start.wait()
+            return [len(self.registry.get_all_source_info()) for _ in range(200)]
+        
+        # Switch threads as often as possible so reads and writes interleave
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=num_threads * 2) as executor:
+                writers = [executor.submit(change_priorities, offset) for offset in range(num_threads)]
+                readers = [executor.submit(list_sources) for _ in range(num_threads)]
+                for future in writers:
+                    future.result()
+                listing_sizes = [size for future in readers for size in future.result()]
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        self.assertEqual(set(listing_sizes), {len(names)})
+        self.assertEqual(
+            sorted(info["name"] for info in self.registry.get_all_source_info()),
+            sorted(names)
+        )
+    
+    def test_get_all_source_entries(self):
+        """Test getting the entries of all job sources."""
+        # Register sources
+        self.registry.register_source(self.test_source1, priority=5, enabled=True, config={"key": 1})
+        self.registry.register_source(self.test_source2, priority=10, enabled=False)
+        
+        entries = self.registry.get_all_source_entries()
+        
+        # Verify entries are sorted by priority and match the registry's settings
+        self.assertEqual([name for name, _ in entries], ["source2", "source1"])
+        for name, entry in entries:
+            self.assertIsInstance(entry, SourceEntry)
+            self.assertEqual(entry, self.registry.entries[name])
+        
+        # Verify changing a returned entry leaves the registry and its caches untouched
+        self.assertIs(self.registry.get_primary_source(), self.test_source1)
+        _, entry = entries[1]
+        entry.enabled = False
+        entry.priority = 20
+        entry.config["key"] = 2
+        self.assertTrue(self.registry.entries["source1"].enabled)
+        self.assertEqual(self.registry.get_source_config("source1"), {"key": 1})
+        self.assertIs(self.registry.get_primary_source(), self.test_source1)
+        self.assertEqual(
+            [name for name, _ in self.registry.get_all_source_entries()],
+            ["source2", "source1"]
+        )
+    
     def test_save_load_config(self):
         """Test saving and loading the registry configuration."""
-        # Create a temporary file for the configuration
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            config_file = tmp.name
+        # Register sources with various settings
+        self.registry.register_source(
+            self.test_source1, 
+            priority=5, 
+            enabled=True, 
+            weight=10, 
+            config={"key1": "value1"}
+        )
+        self.registry.register_source(
+            self.test_source2, 
+            priority=10, 
+            enabled=False, 
+            weight=5, 
+            config={"key2": 42}
+        )
         
-        try:
-            # Register sources with various settings
-            self.registry.register_source(
-                self.test_source1, 
-                priority=5, 
-                enabled=True, 
-                weight=10, 
-                config={"key1": "value1"}
-            )
-            self.registry.register_source(
-                self.test_source2, 
-                priority=10, 
-                enabled=False, 
-                weight=5, 
-                config={"key2": 42}
-            )
+        # Save the configuration to an in-memory buffer
+        buf = io.StringIO()
+        result = self.registry.save_config_stream(buf)
+        self.assertTrue(result)
+        buf.seek(0)
+        
+        # Load the configuration in a new registry
+        new_registry = JobSourceRegistry()
+        
+        # Mock the import module to return our test source class
+        with patch('importlib.import_module') as mock_import:
+            # Mock the module with our TestJobSource class
+            mock_module = MagicMock()
+            mock_module.TestJobSource = TestJobSource
+            mock_import.return_value = mock_module
             
-            # Save the configuration
-            result = self.registry.save_config(config_file)
+            # Load the configuration
+            result = new_registry.load_config_stream(buf)
             self.assertTrue(result)
-            
-            # Load the configuration in a new registry
-            new_registry = JobSourceRegistry()
-            
-            # Mock the import module to return our test source class
-            with patch('importlib.import_module') as mock_import:
-                # Mock the module with our TestJobSource class
-                mock_module = MagicMock()
-                mock_module.TestJobSource = TestJobSource
-                mock_import.return_value = mock_module
-                
-                # Load the configuration
-                result = new_registry.load_config(config_file)
-                self.assertTrue(result)
-            
-            # Just verify that a source was loaded - we can't be certain about the exact structure
-            # after mocking the import module
-            self.assertGreater(len(new_registry.sources), 0)
         
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(config_file):
-                os.unlink(config_file)
+        # Just verify that a source was loaded - we can't be certain about the exact structure
+        # after mocking the import module
+        self.assertGreater(len(new_registry.sources), 0)
     
-    def test_distribute_search_primary(self):
-        """Test distributing a search using the primary strategy."""
-        # Register sources with different priorities
-        self.registry.register_source(self.test_source1, priority=5, enabled=True)
-        self.registry.register_source(self.test_source2, priority=10, enabled=True)
-        self.registry.register_source(self.test_source3, priority=1, enabled=True)
+    def test_load_config_caches_source_classes(self):
+        """Test that each source class is imported only once while loading."""
+        self.registry.register_source(self.test_source1, priority=5)
+        self.registry.register_source(self.test_source2, priority=10)
         
-        # Distribute search using primary strategy
-        source, results = self.registry.distribute_search(
-            keywords="test keywords",
-            location="test location",
-            strategy="primary"
-        )
+        buf = io.StringIO()
+        self.registry.save_config_stream(buf)
         
-        # Verify the highest priority source was used
-        self.assertEqual(source, self.test_source2)
-        self.assertEqual(results["source"], "source2")
-        self.assertEqual(results["keywords"], "test keywords")
-        self.assertEqual(results["location"], "test location")
+        with patch.dict('services.job_search.sources.registry._class_cache', clear=True), \
+                patch('importlib.import_module') as mock_import:
+            mock_module = MagicMock()
+            mock_module.TestJobSource = TestJobSource
+            mock_import.return_value = mock_module
+            
+            # Both sources share a class, so the module is imported once
+            buf.seek(0)
+            new_registry = JobSourceRegistry()
+            self.assertTrue(new_registry.load_config_stream(buf))
+            self.assertEqual(mock_import.call_count, 1)
+            
+            # Loading again resolves the class from the cache
+            buf.seek(0)
+            self.assertTrue(JobSourceRegistry().load_config_stream(buf))
+            self.assertEqual(mock_import.call_count, 1)
         
-        # Verify search count was incremented
-        self.assertEqual(self.test_source2.search_count, 1)
-        self.assertEqual(self.test_source1.search_count, 0)
-        self.assertEqual(self.test_source3.search_count, 0)
+        # Loaded sources are built with default arguments, so both are named "test"
+        self.assertIn("test", new_registry.entries)
     
-    def test_distribute_search_load_balance(self):
-        """Test distributing a search using the load balance strategy."""
-        # Register sources with different weights
-        self.registry.register_source(self.test_source1, weight=1, enabled=True)
-        self.registry.register_source(self.test_source2, weight=0, enabled=True)  # Should be corrected to 1
+    def test_save_load_config_file(self):
+        """Test that the file-based config methods round-trip through a file."""
+        self.registry.register_source(self.test_source1, priority=5, weight=10)
         
-        # Distribute search using load balance strategy
-        source, results = self.registry.distribute_search(
-            keywords="test keywords",
-            strategy="load_balance"
-        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "registry.json")
+            self.assertTrue(self.registry.save_config(config_file))
+            
+            with open(config_file) as f:
+                saved = json.load(f)
         
-        # Verify a source was selected and search was performed
-        self.assertIn(source, [self.test_source1, self.test_source2])
-        self.assertEqual(results["source"], source.source_name)
-        self.assertEqual(results["keywords"], "test keywords")
+        self.assertEqual(saved["sources"]["source1"]["priority"], 5)
+        self.assertEqual(saved["sources"]["source1"]["weight"], 10)
         
-        # Verify search count was incremented for selected source
-        self.assertEqual(self.test_source1.search_count + self.test_source2.search_count, 1)
+        # A missing file is reported as a failed load
+        self.assertFalse(JobSourceRegistry().load_config(config_file))
     
-    def test_distribute_search_all(self):
-        """Test distributing a search to all sources."""
-        # Register sources
-        self.registry.register_source(self.test_source1, priority=1, enabled=True)
-        self.registry.register_source(self.test_source2, priority=2, enabled=True)
-        self.registry.register_source(self.test_source3, priority=3, enabled=False)  # Disabled
+    def test_distribute_search(self):
+        """Test distributing a search with each strategy."""
+        for case_name, strategy, source_specs, expected_source, expected_sources, expected_counts in _STRATEGY_CASES:
+            with self.subTest(case=case_name):
+                # Register fresh sources for this case
+                registry = JobSourceRegistry()
+                sources = {}
+                for name, priority, enabled, weight, fail_search in source_specs:
+                    sources[name] = TestJobSource(name, fail_search=fail_search)
+                    registry.register_source(sources[name], priority=priority, enabled=enabled, weight=weight)
+                
+                source, results = registry.distribute_search(
+                    keywords="test keywords",
+                    location="test location",
+                    strategy=strategy
+                )
+                
+                if expected_source is not None:
+                    # Verify the expected single source was used
+                    self.assertIs(source, sources[expected_source])
+                    self.assertEqual(results["source"], expected_source)
+                    self.assertEqual(results["keywords"], "test keywords")
+                    self.assertEqual(results["location"], "test location")
+                elif expected_sources is not None:
+                    # Verify aggregated results contain only the successful enabled sources
+                    self.assertIsNone(source)
+                    self.assertEqual(results["sources"], expected_sources)
+                    self.assertEqual(sorted(results["raw_results"]), sorted(expected_sources))
+                else:
+                    # Verify no source or results were returned
+                    self.assertIsNone(source)
+                    self.assertIsNone(results)
+                
+                # Verify search counts (failing sources are still searched)
+                for name, count in expected_counts.items():
+                    self.assertEqual(sources[name].search_count, count)
+    
+    def test_distribute_search_all_concurrent(self):
+        """Test that the all strategy searches sources concurrently."""
+        # Each search waits until all three are running at once. Searches run
+        # one after another would time out, and the sources would be reported
+        # as failed and left out of the results.
+        barrier = threading.Barrier(3, timeout=5)
+        slow_sources = [TestJobSource(f"slow{i}", barrier=barrier) for i in range(3)]
+        for priority, source in enumerate(slow_sources):
+            self.registry.register_source(source, priority=priority, enabled=True)
         
         # Distribute search using all strategy
         source, results = self.registry.distribute_search(
@@ -451,97 +782,81 @@ class JobSourceRegistryTests(unittest.TestCase):
             strategy="all"
         )
         
-        # Verify no single source was returned
+        # Verify every search got past the barrier, with results ordered by priority (descending)
+        self.assertFalse(barrier.broken, "the searches ran one after another")
         self.assertIsNone(source)
+        self.assertEqual(results["sources"], ["slow2", "slow1", "slow0"])
+    
+    def test_distribute_search_all_chunking(self):
+        """Test that the all strategy submits at most one chunk per worker."""
+        sources = [TestJobSource(f"many{i}") for i in range(12)]
+        for priority, source in enumerate(sources):
+            self.registry.register_source(source, priority=priority, enabled=True)
+        
+        # With 5 search workers, 12 sources form 4 chunks of 3
+        with patch.object(registry_module, '_SEARCH_WORKERS', 5), \
+                patch.object(registry_module._SEARCH_EXECUTOR, 'submit',
+                             wraps=registry_module._SEARCH_EXECUTOR.submit) as mock_submit:
+            _, results = self.registry.distribute_search(keywords="test keywords", strategy="all")
+        
+        self.assertEqual(mock_submit.call_count, 4)
+        self.assertEqual(results["sources"], [f"many{i}" for i in reversed(range(12))])
+        for source in sources:
+            self.assertEqual(source.search_count, 1)
+    
+    def test_distribute_search_all_deduplicate(self):
+        """Test that the all strategy can drop jobs repeated across sources."""
+        self.registry.register_source(self.test_source1, priority=3, enabled=True)
+        self.registry.register_source(self.test_source2, priority=2, enabled=True)
+        self.registry.register_source(MirrorJobSource("mirror"), priority=1, enabled=True)
         
-        # Verify results contains both enabled sources
-        self.assertIn("sources", results)
-        self.assertEqual(len(results["sources"]), 2)
-        self.assertIn("source1", results["sources"])
-        self.assertIn("source2", results["sources"])
-        self.assertNotIn("source3", results["sources"])
-        
-        # Verify raw results for each source
-        self.assertIn("raw_results", results)
-        self.assertIn("source1", results["raw_results"])
-        self.assertIn("source2", results["raw_results"])
-        self.assertNotIn("source3", results["raw_results"])
-        
-        # Verify search count was incremented for enabled sources only
-        self.assertEqual(self.test_source1.search_count, 1)
-        self.assertEqual(self.test_source2.search_count, 1)
-        self.assertEqual(self.test_source3.search_count, 0)
-    
-    def test_distribute_search_error_handling(self):
-        """Test error handling during search distribution."""
-        # Register sources - one will fail
-        self.registry.register_source(self.test_source1, priority=1, enabled=True)
-        failing_source = TestJobSource("failing", fail_search=True)
-        self.registry.register_source(failing_source, priority=2, enabled=True)
+        # Without deduplication only raw results are returned
+        _, results = self.registry.distribute_search(keywords="test keywords", strategy="all")
+        self.assertNotIn("normalized_jobs", results)
         
-        # Distribute search using all strategy
-        source, results = self.registry.distribute_search(
+        # With deduplication the mirrored copy of source1's job is dropped
+        _, results = self.registry.distribute_search(
             keywords="test keywords",
-            strategy="all"
+            strategy="all",
+            deduplicate=True
         )
-        
-        # Verify no single source was returned
-        self.assertIsNone(source)
-        
-        # Verify results contains only the successful source
-        self.assertIn("sources", results)
-        self.assertEqual(len(results["sources"]), 1)
-        self.assertIn("source1", results["sources"])
-        self.assertNotIn("failing", results["sources"])
-        
-        # Verify raw results for successful source only
-        self.assertIn("raw_results", results)
-        self.assertIn("source1", results["raw_results"])
-        self.assertNotIn("failing", results["raw_results"])
-        
-        # Verify search count was incremented for both sources (even the failing one)
-        self.assertEqual(self.test_source1.search_count, 1)
-        self.assertEqual(failing_source.search_count, 1)
+        self.assertEqual(results["sources"], ["source1", "source2", "mirror"])
+        self.assertEqual(len(results["raw_results"]), 3)
+        source_ids = [job["source_id"] for job in results["normalized_jobs"]]
+        self.assertEqual(source_ids, ["source1_1", "source2_1"])
     
-    def test_distribute_search_no_sources(self):
-        """Test distributing a search when no sources are enabled."""
-        # Distribute search with empty registry
-        source, results = self.registry.distribute_search(
-            keywords="test keywords",
-            strategy="primary"
-        )
+    def test_distribute_search_all_deduplicate_keeps_jobs_without_ids(self):
+        """Test that deduplication keeps every job that has no source_id."""
+        self.registry.register_source(self.test_source1, priority=3, enabled=True)
+        self.registry.register_source(UnidentifiedJobSource("anon1"), priority=2, enabled=True)
+        self.registry.register_source(UnidentifiedJobSource("anon2"), priority=1, enabled=True)
         
-        # Verify no source or results were returned
-        self.assertIsNone(source)
-        self.assertIsNone(results)
-        
-        # Register a disabled source
-        self.registry.register_source(self.test_source1, enabled=False)
-        
-        # Distribute search with disabled sources
-        source, results = self.registry.distribute_search(
+        _, results = self.registry.distribute_search(
             keywords="test keywords",
-            strategy="primary"
+            strategy="all",
+            deduplicate=True
         )
         
-        # Verify no source or results were returned
-        self.assertIsNone(source)
-        self.assertIsNone(results)
+        source_ids = [job["source_id"] for job in results["normalized_jobs"]]
+        self.assertEqual(source_ids, ["source1_1"] + [None] * 6)
     
-    def test_distribute_search_invalid_strategy(self):
-        """Test distributing a search with an invalid strategy."""
-        # Register a source
-        self.registry.register_source(self.test_source1, enabled=True)
+    def test_distribute_search_all_deduplicate_during_reload(self):
+        """Test that deduplication uses the searched sources when the config is reloaded."""
+        racy_source = ReloadingJobSource("racy", self.registry)
+        self.registry.register_source(self.test_source1, priority=2, enabled=True)
+        self.registry.register_source(racy_source, priority=1, enabled=True)
         
-        # Distribute search with invalid strategy
-        source, results = self.registry.distribute_search(
+        _, results = self.registry.distribute_search(
             keywords="test keywords",
-            strategy="invalid_strategy"
+            strategy="all",
+            deduplicate=True
         )
         
-        # Verify no source or results were returned
-        self.assertIsNone(source)
-        self.assertIsNone(results)
-
+        # The reload emptied the registry, but both searched sources are still parsed
+        self.assertEqual(self.registry.entries, {})
+        self.assertEqual(results["sources"], ["source1", "racy"])
+        source_ids = [job["source_id"] for job in results["normalized_jobs"]]
+        self.assertEqual(source_ids, ["source1_1", "racy_1"])
+    
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit tests for the Sample job source.
+
+These tests verify that the structured results of SampleJobSource
+match the jobs parsed from its text output.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+if __name__ == "__main__":
+    # Run as a script: add the backend directory to the path (pytest uses pytest.ini)
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from services.job_search.sources import SampleJobSource
+
+
+class SampleJobSourceTests(unittest.TestCase):
+    """Unit tests for the SampleJobSource class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.source = SampleJobSource()
+
+    def test_structured_results_match_text_parsing(self):
+        """Test that structured results equal the parsed text results."""
+        search_filters = {"experience_level": "senior"}
+
+        # Generate the same jobs twice, with and without the text content
+        random.seed(0)
+        structured_raw = self.source.search_jobs(
+            "python engineer", filters=search_filters, params={"return_structured": True}
+        )
+        random.seed(0)
+        text_raw = self.source.search_jobs("python engineer", filters=search_filters)
+
+        structured_jobs = self.source.parse_results(structured_raw)
+        text_jobs = self.source.parse_results(text_raw)
+
+        self.assertGreater(len(structured_jobs), 0)
+        self.assertEqual(structured_jobs, text_jobs)
+
+    def test_default_search_returns_text_only(self):
+        """Test that a default search returns only the mock API text content."""
+        raw = self.source.search_jobs("python")
+
+        self.assertEqual(list(raw), ["choices"])
+        self.assertEqual(list(raw["choices"][0]["message"]), ["content"])
+        jobs = self.source.parse_results(raw)
+        self.assertGreater(len(jobs), 0)
+        for job in jobs:
+            self.assertIn("title", job)
+            self.assertIn("requirements", job)
+
+    def test_format_jobs_layout(self):
+        """Test the exact text layout of formatted job listings."""
+        job = {
+            "title": "QA Engineer",
+            "company": "DevHub",
+            "location": "Remote",
+            "job_type": "Contract",
+            "salary": "$90,000 - $100,000 per year",
+            "date_posted": "3 days ago",
+            "requirements": ["Python", "Git"],
+            "benefits": ["Free lunch"]
+        }
+        job["description"] = self.source._format_description(job)
+        job["full_text"] = self.source._format_job(job)
+
+        listing = (
+            "QA Engineer at DevHub\n"
+            "Location: Remote\n"
+            "Job Type: Contract\n"
+            "Salary: $90,000 - $100,000 per year\n"
+            "Posted: 3 days ago\n"
+            "Requirements:\n"
+            "- Python\n"
+            "- Git\n"
+            "Benefits:\n"
+            "- Free lunch\n"
+        )
+        self.assertEqual(self.source._format_jobs([job, job]), listing + "\n\n" + listing)
+
+    def test_return_structured_search(self):
+        """Test that return_structured skips building the text content."""
+        raw = self.source.search_jobs("python", params={"return_structured": True})
+
+        message = raw["choices"][0]["message"]
+        self.assertEqual(message["content"], "")
+        self.assertIs(self.source.parse_results(raw), message["structured"])
+
+    def test_normalize_job(self):
+        """Test normalizing a structured job."""
+        raw = self.source.search_jobs("python")
+        job = self.source.parse_results(raw)[0]
+
+        normalized = self.source.normalize_job(job)
+
+        self.assertEqual(normalized["source"], "Sample")
+        self.assertEqual(normalized["title"], job["title"])
+        self.assertEqual(normalized["requirements"], job["requirements"])
+        self.assertTrue(normalized["description"].startswith(job["title"]))
+        self.assertNotIn("Requirements:", normalized["description"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,12 @@ Test runner for Job Source Registry tests.
 This script discovers and runs all tests related to the Job Source Registry.
 """
 
+import argparse
+import io
 import os
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 
 # Add the parent directory to the path so we can import our modules
@@ -24,36 +27,73 @@ if os.getenv("PERPLEXITY_API_KEY"):
 else:
     print("PERPLEXITY_API_KEY is NOT set")
 
-if __name__ == "__main__":
-    # Create a test loader
-    loader = unittest.TestLoader()
-    
-    # Start with an empty test suite
+# Test modules for each stage, loaded by name
+UNIT_TEST_MODULES = ['job_search.test_job_source_registry']
+INTEGRATION_TEST_MODULES = ['job_search.test_registry_integration']
+
+
+def run_stage(loader, runner, module_names):
+    """Load the named test modules into one suite and run it."""
     suite = unittest.TestSuite()
+    suite.addTests(loader.loadTestsFromNames(module_names))
+    return runner.run(suite)
+
+
+def run_module(module_name):
+    """Run one test module, returning whether it passed and the runner's output."""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromName(module_name)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def run_in_parallel(module_names):
+    """Run each test module in its own process and print the outputs in order."""
+    with ProcessPoolExecutor(max_workers=len(module_names)) as executor:
+        outcomes = list(executor.map(run_module, module_names))
     
-    # Add registry core tests first since they don't require external dependencies
-    print("\nRunning Job Source Registry unit tests...")
-    registry_tests = loader.loadTestsFromName('job_search.test_job_source_registry', module=None)
-    suite.addTest(registry_tests)
+    for module_name, (_, output) in zip(module_names, outcomes):
+        print(f"\n{module_name}:")
+        print(output, end="")
     
-    # Run the unit tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    unit_result = runner.run(suite)
+    return all(passed for passed, _ in outcomes)
+
+
+if __name__ == "__main__":
+    # Parse which stages to run
+    parser = argparse.ArgumentParser(description="Run the Job Source Registry tests.")
+    stage = parser.add_mutually_exclusive_group()
+    stage.add_argument("--unit", action="store_true", help="run only the unit tests")
+    stage.add_argument("--integration", action="store_true", help="run only the integration tests")
+    stage.add_argument("--all", action="store_true",
+                       help="run the unit tests, then the integration tests (default)")
+    stage.add_argument("--parallel", action="store_true",
+                       help="run every test module at once, each in its own process")
+    args = parser.parse_args()
+    
+    if args.parallel:
+        print("\nRunning all Job Source Registry tests in parallel...")
+        sys.exit(not run_in_parallel(UNIT_TEST_MODULES + INTEGRATION_TEST_MODULES))
     
-    # If unit tests pass, try running the integration tests
-    if unit_result.wasSuccessful():
-        print("\nUnit tests passed. Running integration tests...")
-        integration_tests = loader.loadTestsFromName('job_search.test_registry_integration', module=None)
-        integration_suite = unittest.TestSuite()
-        integration_suite.addTest(integration_tests)
-        integration_result = runner.run(integration_suite)
-        
-        # Return overall success/failure
-        print("\nTest Summary:")
-        print(f"Unit Tests: {'PASSED' if unit_result.wasSuccessful() else 'FAILED'}")
-        print(f"Integration Tests: {'PASSED' if integration_result.wasSuccessful() else 'FAILED'}")
-        
-        sys.exit(not (unit_result.wasSuccessful() and integration_result.wasSuccessful()))
+    # Run the selected tests in one suite, stopping at the first failure.
+    # Registry core tests come first since they don't require external dependencies
+    if args.unit:
+        print("\nRunning Job Source Registry unit tests...")
+        module_names = UNIT_TEST_MODULES
+    elif args.integration:
+        print("\nRunning Job Source Registry integration tests...")
+        module_names = INTEGRATION_TEST_MODULES
     else:
-        print("\nUnit tests failed. Skipping integration tests.")
-        sys.exit(1)
+        print("\nRunning Job Source Registry unit and integration tests...")
+        module_names = UNIT_TEST_MODULES + INTEGRATION_TEST_MODULES
+    
+    runner = unittest.TextTestRunner(verbosity=2, failfast=True)
+    result = run_stage(unittest.TestLoader(), runner, module_names)
+    
+    # Return overall success/failure
+    print("\nTest Summary:")
+    print(f"Tests Run: {result.testsRun}")
+    print(f"Failures: {len(result.failures)}")
+    print(f"Errors: {len(result.errors)}")
+    
+    sys.exit(not result.wasSuccessful())
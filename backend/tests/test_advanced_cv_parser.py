@@ -1,20 +1,18 @@
 import pytest
 import os
 import io
+import importlib.util
+import textwrap
 from unittest.mock import MagicMock, patch
-from services.advanced_cv_parser.advanced_cv_parser import AdvancedCVParser
+from services.advanced_cv_parser.advanced_cv_parser import AdvancedCVParser, _SECTION_HEADINGS
 
+# Checked without building a parser, so collection never loads the model
+_HAS_EMBEDDING = importlib.util.find_spec("sentence_transformers") is not None
+_HAS_AHOCORASICK = importlib.util.find_spec("ahocorasick") is not None
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
-class TestAdvancedCVParser:
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return AdvancedCVParser()
-    
-    @pytest.fixture
-    def sample_cv_text(self):
-        """Sample CV text for testing extraction methods."""
-        return """
+# Sample CV text for testing extraction methods
+_SAMPLE_CV_TEXT = """
         John Doe
         john.doe@example.com
         (123) 456-7890
@@ -63,10 +61,17 @@ class TestAdvancedCVParser:
         • Built with React, Next.js, and Tailwind CSS
         • Features a blog, portfolio, and contact form
         """
+
+
+class TestAdvancedCVParser:
+    @pytest.fixture(scope="module")
+    def parser(self):
+        """Create a parser instance shared by the tests in this module."""
+        return AdvancedCVParser()
     
-    def test_extract_personal_information(self, parser, sample_cv_text):
+    def test_extract_personal_information(self, parser):
         """Test extraction of personal information."""
-        result = parser._extract_personal_information(sample_cv_text)
+        result = parser._extract_personal_information(_SAMPLE_CV_TEXT)
         
         assert result["name"] == "John Doe"
         assert result["email"] == "john.doe@example.com"
@@ -76,9 +81,9 @@ class TestAdvancedCVParser:
         assert result["github"] == "github.com/johndoe"
         assert result["website"] == "https://johndoe.com"
 
-    def test_extract_skills(self, parser, sample_cv_text):
+    def test_extract_skills(self, parser):
         """Test extraction of skills."""
-        result = parser._extract_skills(sample_cv_text)
+        result = parser._extract_skills(_SAMPLE_CV_TEXT)
         
         # Test technical skills extraction
         assert "JavaScript" in result["technical"]
@@ -93,9 +98,21 @@ class TestAdvancedCVParser:
         assert "Communication" in result["soft"]
         assert "Teamwork" in result["soft"]
 
-    def test_extract_work_experience(self, parser, sample_cv_text):
+    def test_skill_keyword_patterns(self, parser):
+        """Test that the skills trie regexes match whole keywords only."""
+        # Keywords like "c++" end in a non-word character, so \b never follows them
+        for skill in parser.TECHNICAL_SKILLS_KEYWORDS:
+            if skill[-1].isalnum():
+                assert parser.TECHNICAL_SKILLS_RE.fullmatch(skill.upper())
+        for skill in parser.SOFT_SKILLS_KEYWORDS:
+            assert parser.SOFT_SKILLS_RE.fullmatch(skill)
+
+        # Keywords inside longer words are not matched
+        assert parser.TECHNICAL_SKILLS_RE.findall("javascripts, gopher, java") == ["java"]
+
+    def test_extract_work_experience(self, parser):
         """Test extraction of work experience."""
-        result = parser._extract_work_experience(sample_cv_text)
+        result = parser._extract_work_experience(_SAMPLE_CV_TEXT)
         
         assert len(result) == 2  # Two job entries
         
@@ -113,9 +130,9 @@ class TestAdvancedCVParser:
         assert result[1]["duration"] == "March 2017 - December 2019"
         assert len(result[1]["responsibilities"]) == 2
 
-    def test_extract_education(self, parser, sample_cv_text):
+    def test_extract_education(self, parser):
         """Test extraction of education."""
-        result = parser._extract_education(sample_cv_text)
+        result = parser._extract_education(_SAMPLE_CV_TEXT)
         
         assert len(result) == 2  # Two education entries
         
@@ -131,18 +148,18 @@ class TestAdvancedCVParser:
         assert result[1]["field"] == "Computer Engineering"
         assert result[1]["duration"] == "2011 - 2015"
 
-    def test_extract_certifications(self, parser, sample_cv_text):
+    def test_extract_certifications(self, parser):
         """Test extraction of certifications."""
-        result = parser._extract_certifications(sample_cv_text)
+        result = parser._extract_certifications(_SAMPLE_CV_TEXT)
         
         assert len(result) == 1
         assert result[0]["name"] == "AWS Certified Solutions Architect"
         assert result[0]["date"] == "2021"
         assert result[0]["issuer"] == "Amazon Web Services"
 
-    def test_extract_languages(self, parser, sample_cv_text):
+    def test_extract_languages(self, parser):
         """Test extraction of languages."""
-        result = parser._extract_languages(sample_cv_text)
+        result = parser._extract_languages(_SAMPLE_CV_TEXT)
         
         assert len(result) == 3
         
@@ -155,29 +172,53 @@ class TestAdvancedCVParser:
         assert result[2]["language"] == "French"
         assert result[2]["proficiency"] == "Basic"
 
-    def test_extract_projects(self, parser, sample_cv_text):
+    def test_extract_projects(self, parser):
         """Test extraction of projects."""
-        result = parser._extract_projects(sample_cv_text)
+        result = parser._extract_projects(_SAMPLE_CV_TEXT)
         
         assert len(result) == 1
         assert result[0]["name"] == "Personal Website (2022)"
         assert "React" in result[0]["technologies"]
         assert len(result[0]["technologies"]) >= 2  # At least React and CSS
 
-    def test_extract_summary(self, parser, sample_cv_text):
+    def test_extract_summary(self, parser):
         """Test extraction of summary."""
-        result = parser._extract_summary(sample_cv_text)
+        result = parser._extract_summary(_SAMPLE_CV_TEXT)
         
         assert "Experienced software engineer" in result
         assert "web development" in result
 
-    def test_parse_cv_integration(self, parser, sample_cv_text):
+    def test_split_sections(self, parser):
+        """Test that extractors give the same results from pre-split sections."""
+        # Section headings are only recognised at the start of a line
+        cv_text = textwrap.dedent(_SAMPLE_CV_TEXT)
+        sections = parser._split_sections(cv_text)
+
+        assert "JavaScript" in sections["skills"]
+        assert "Stanford University" in sections["education"]
+        assert parser._extract_skills(cv_text, sections) == parser._extract_skills(cv_text)
+        assert parser._extract_education(cv_text, sections) == parser._extract_education(cv_text)
+
+    @pytest.mark.parametrize("cv_text", [
+        textwrap.dedent(_SAMPLE_CV_TEXT),
+        _SAMPLE_CV_TEXT,
+        "Skills: Python\nEducational Background\nMIT\n#\n\nExperience\nAcme\nSkills",
+        "Experienced engineer\nSKILLS - Go\n\nEducation:\nOxford\n## Projects\n",
+    ])
+    def test_split_sections_matches_extract_section(self, parser, cv_text):
+        """Test that the indexed section split finds the same sections as _extract_section."""
+        sections = parser._split_sections(cv_text)
+
+        for key, (section_names, end_sections) in _SECTION_HEADINGS.items():
+            assert sections[key] == parser._extract_section(cv_text, section_names, end_sections)
+
+    def test_parse_cv_integration(self, parser):
         """Test the complete CV parsing process with a file."""
         # Create a sample CV file in memory
-        file_obj = io.BytesIO(sample_cv_text.encode('utf-8'))
+        file_obj = io.BytesIO(_SAMPLE_CV_TEXT.encode('utf-8'))
         
         # Mock the document parser to return our sample text
-        with patch.object(parser.base_parser, 'parse_document', return_value=sample_cv_text):
+        with patch.object(parser.base_parser, 'parse_document', return_value=_SAMPLE_CV_TEXT):
             result = parser.parse_cv(file_obj, "sample_cv.pdf")
         
         # Verify the structure of the result
@@ -203,20 +244,64 @@ class TestAdvancedCVParser:
         assert len(result["languages"]) == 3
         assert len(result["projects"]) == 1
 
-    @pytest.mark.skipif(AdvancedCVParser().embedding_model is None, 
-                        reason="Sentence transformer not available")
-    def test_embedding_based_skill_extraction(self, parser, sample_cv_text):
+    @pytest.mark.skipif(not _HAS_EMBEDDING, reason="Sentence transformer not available")
+    def test_embedding_based_skill_extraction(self, parser):
         """Test embedding-based skill extraction if available."""
         # This test will be skipped if embedding model isn't available
-        
+        if parser.embedding_model is None:
+            # The package is installed but the model failed to load
+            pytest.skip("Sentence transformer model could not be loaded")
+
         # Add a skill that's semantically similar but not exactly matching our keywords
-        modified_cv = sample_cv_text + "\nFamiliar with cloud infrastructure management"
+        modified_cv = _SAMPLE_CV_TEXT + "\nFamiliar with cloud infrastructure management"
         
         result = parser._extract_skills(modified_cv)
         
         # Check if semantically similar terms are matched via embeddings
         assert any(item for item in ["AWS", "GCP", "Azure"] if item in result["technical"])
 
+    @pytest.mark.skipif(not _HAS_NUMPY, reason="NumPy not available")
+    def test_embedding_batch_failure_falls_back_per_candidate(self, parser):
+        """Test that one phrase failing to embed only drops that phrase's matches."""
+        import numpy as np
+
+        vectors = {"python": [1.0, 0.0], "teamwork": [0.0, 1.0]}
+
+        def encode(texts):
+            if "broken" in texts:
+                raise RuntimeError("cannot embed")
+            return np.array([vectors.get(text.lower(), [0.0, 0.0]) for text in texts])
+
+        model = MagicMock()
+        model.encode.side_effect = encode
+        # The parser module only imports NumPy together with sentence_transformers
+        with patch("services.advanced_cv_parser.advanced_cv_parser.np", np), patch.multiple(
+            parser,
+            embedding_model=model,
+            technical_skills=["python"],
+            technical_skills_embeddings=np.array([[1.0, 0.0]], dtype=np.float32),
+            soft_skills=["teamwork"],
+            soft_skills_embeddings=np.array([[0.0, 1.0]], dtype=np.float32),
+            create=True,
+        ):
+            matches = parser._match_skill_embeddings("Python, broken, Teamwork")
+
+        assert matches == {"technical": ["python"], "soft": ["teamwork"]}
+        # One batch call, then one call per phrase
+        assert model.encode.call_count == 4
+
+    @pytest.mark.skipif(not _HAS_AHOCORASICK, reason="pyahocorasick not available")
+    def test_skill_automaton_matches_keyword_regexes(self, parser):
+        """Test that the skills automaton finds the same keywords as the regex fallback."""
+        automaton = parser._skill_automaton
+        try:
+            parser._skill_automaton = None
+            expected = parser._match_skill_keywords(_SAMPLE_CV_TEXT)
+        finally:
+            parser._skill_automaton = automaton
+
+        assert parser._match_skill_keywords(_SAMPLE_CV_TEXT) == expected
+
     def test_empty_cv_text(self, parser):
         """Test handling of empty CV text."""
         with pytest.raises(ValueError):
@@ -265,28 +350,39 @@ class TestAdvancedCVParser:
         assert result["work_experience"] == []
         assert len(result["education"]) <= 1
 
-    def test_openai_enhancement_disabled(self, parser, sample_cv_text):
+    def test_openai_enhancement_disabled(self, parser):
         """Test that OpenAI enhancement is not used by default."""
-        with patch.object(parser.base_parser, 'parse_document', return_value=sample_cv_text):
+        with patch.object(parser.base_parser, 'parse_document', return_value=_SAMPLE_CV_TEXT):
             with patch.object(parser, '_enhance_with_ai') as mock_enhance:
                 parser.parse_cv(io.BytesIO(b"content"), "cv.pdf")
                 mock_enhance.assert_not_called()
 
     @patch.dict(os.environ, {"USE_LLM_ENHANCEMENT": "true"})
-    def test_openai_enhancement_enabled(self, parser, sample_cv_text):
+    def test_openai_enhancement_enabled(self, parser):
         """Test that OpenAI enhancement is used when enabled."""
-        # Mock the OpenAI client
-        parser.api_key = "test_key"
-        parser.openai_client = MagicMock()
-        
-        # Setup the mock response
-        mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = '{}'
-        mock_response.choices = [mock_choice]
-        parser.openai_client.chat.completions.create.return_value = mock_response
-        
-        with patch.object(parser.base_parser, 'parse_document', return_value=sample_cv_text):
-            with patch.object(parser, '_enhance_with_ai', wraps=parser._enhance_with_ai) as mock_enhance:
-                parser.parse_cv(io.BytesIO(b"content"), "cv.pdf")
-                mock_enhance.assert_called_once()
+        # The parser is shared, so remember the client settings to restore
+        original_api_key = parser.api_key
+        original_client = getattr(parser, "openai_client", None)
+        
+        try:
+            # Mock the OpenAI client
+            parser.api_key = "test_key"
+            parser.openai_client = MagicMock()
+            
+            # Setup the mock response
+            mock_response = MagicMock()
+            mock_choice = MagicMock()
+            mock_choice.message.content = '{}'
+            mock_response.choices = [mock_choice]
+            parser.openai_client.chat.completions.create.return_value = mock_response
+            
+            with patch.object(parser.base_parser, 'parse_document', return_value=_SAMPLE_CV_TEXT):
+                with patch.object(parser, '_enhance_with_ai', wraps=parser._enhance_with_ai) as mock_enhance:
+                    parser.parse_cv(io.BytesIO(b"content"), "cv.pdf")
+                    mock_enhance.assert_called_once()
+        finally:
+            parser.api_key = original_api_key
+            if original_client is None:
+                del parser.openai_client
+            else:
+                parser.openai_client = original_client
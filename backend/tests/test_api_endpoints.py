@@ -10,10 +10,6 @@ import os
 import json
 import requests
 import time
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 # API base URL
 BASE_URL = "http://localhost:5001/api"
@@ -21,57 +17,59 @@ BASE_URL = "http://localhost:5001/api"
 def test_api_endpoints():
     """Test the Career Coach API endpoints."""
     try:
-        print("Testing API endpoints...")
+        # Reuse one connection for every request to the server
+        with requests.Session() as client:
+            print("Testing API endpoints...")
         
-        # 1. Health check
-        print("\nTesting health check endpoint...")
-        response = requests.get(f"{BASE_URL}/health")
-        if response.status_code != 200:
-            print(f"Error: Health check failed with status code {response.status_code}")
-            print(response.text)
-            return
+            # 1. Health check
+            print("\nTesting health check endpoint...")
+            response = client.get(f"{BASE_URL}/health")
+            if response.status_code != 200:
+                print(f"Error: Health check failed with status code {response.status_code}")
+                print(response.text)
+                return
         
-        print("Health check succeeded:")
-        print(json.dumps(response.json(), indent=2))
+            print("Health check succeeded:")
+            print(json.dumps(response.json(), indent=2))
         
-        # 2. Create session
-        print("\nCreating a coaching session...")
-        response = requests.post(f"{BASE_URL}/career-coach/sessions", json={"user_id": "test_user_api"})
-        if response.status_code != 201:
-            print(f"Error: Create session failed with status code {response.status_code}")
-            print(response.text)
-            return
+            # 2. Create session
+            print("\nCreating a coaching session...")
+            response = client.post(f"{BASE_URL}/career-coach/sessions", json={"user_id": "test_user_api"})
+            if response.status_code != 201:
+                print(f"Error: Create session failed with status code {response.status_code}")
+                print(response.text)
+                return
         
-        print("Session created:")
-        print(json.dumps(response.json(), indent=2))
+            print("Session created:")
+            print(json.dumps(response.json(), indent=2))
         
-        # Extract session ID
-        session_id = response.json()["session_id"]
+            # Extract session ID
+            session_id = response.json()["session_id"]
         
-        # 3. Send a message
-        print("\nSending a message...")
-        message = "Hi, I'm a software developer with 5 years of experience. I'm looking to advance my career and possibly move into a leadership role."
-        response = requests.post(f"{BASE_URL}/career-coach/sessions/{session_id}/messages", json={"message": message})
-        if response.status_code != 200:
-            print(f"Error: Send message failed with status code {response.status_code}")
-            print(response.text)
-            return
+            # 3. Send a message
+            print("\nSending a message...")
+            message = "Hi, I'm a software developer with 5 years of experience. I'm looking to advance my career and possibly move into a leadership role."
+            response = client.post(f"{BASE_URL}/career-coach/sessions/{session_id}/messages", json={"message": message})
+            if response.status_code != 200:
+                print(f"Error: Send message failed with status code {response.status_code}")
+                print(response.text)
+                return
         
-        print("Message sent:")
-        print(f"Response: {response.json()['response'][:200]}...")
+            print("Message sent:")
+            print(f"Response: {response.json()['response'][:200]}...")
         
-        # 4. Get session summary
-        print("\nGetting session summary...")
-        response = requests.get(f"{BASE_URL}/career-coach/sessions/{session_id}")
-        if response.status_code != 200:
-            print(f"Error: Get session summary failed with status code {response.status_code}")
-            print(response.text)
-            return
+            # 4. Get session summary
+            print("\nGetting session summary...")
+            response = client.get(f"{BASE_URL}/career-coach/sessions/{session_id}")
+            if response.status_code != 200:
+                print(f"Error: Get session summary failed with status code {response.status_code}")
+                print(response.text)
+                return
         
-        print("Session summary:")
-        print(json.dumps(response.json()["summary"], indent=2))
+            print("Session summary:")
+            print(json.dumps(response.json()["summary"], indent=2))
         
-        print("\nAPI endpoint tests completed successfully!")
+            print("\nAPI endpoint tests completed successfully!")
     
     except requests.exceptions.ConnectionError:
         print(f"Error: Could not connect to the API server at {BASE_URL}")
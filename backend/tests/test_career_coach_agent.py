@@ -6,41 +6,65 @@ This script demonstrates the basic functionality of the Career Coach Agent
 by simulating a conversation, CV analysis, and roadmap generation.
 """
 
-import sys
 import os
+import sys
 import json
 import uuid
-import shutil
-from dotenv import load_dotenv
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 import pytest
 
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Load environment variables from .env file
-load_dotenv()
+if __name__ == "__main__":
+    # Run as a script: add the backend directory to the path (pytest uses pytest.ini)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.career_coach import CareerCoachAgent
 from services.career_coach.conversation_flow import ConversationPhase
 
-
-@pytest.fixture
-def career_coach():
-    """Fixture to create and cleanup CareerCoachAgent instance."""
-    # Verify required environment variables
-    if not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-    agent = CareerCoachAgent()
-
-    # Store the data directory for cleanup
-    data_dir = agent.user_data_dir
-
-    yield agent
-
-    # Cleanup: remove test data directory if it exists
-    if os.path.exists(data_dir):
-        shutil.rmtree(data_dir)
+# Canned OpenAI replies, so the tests never call the API
+_FAKE_CHAT_REPLY = "Thanks for sharing that. What would you most like to change in your next role?"
+_FAKE_CV_ANALYSIS = {
+    "skills": {
+        "technical": ["Python", "JavaScript", "Docker"],
+        "soft": ["Team leadership", "Problem-solving"]
+    },
+    "work_experience": [
+        {"position": "Senior Software Engineer", "company": "Tech Corp", "duration": "2018-present"}
+    ],
+    "analysis": {
+        "strengths": ["Technical leadership"],
+        "industry_fit": ["Software"],
+        "role_fit": ["Engineering Manager"]
+    }
+}
+_FAKE_ROADMAP = {
+    "short_term_goals": ["Lead a small project team"],
+    "medium_term_goals": ["Become a technical lead"],
+    "long_term_vision": "Head of engineering"
+}
+
+
+def _fake_completion(model, messages, response_format=None):
+    """Return a canned chat completion shaped like the OpenAI client's response."""
+    if response_format is None:
+        content = _FAKE_CHAT_REPLY
+    elif "roadmap" in messages[0]["content"]:
+        content = json.dumps(_FAKE_ROADMAP)
+    else:
+        content = json.dumps(_FAKE_CV_ANALYSIS)
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(scope="session")
+def career_coach(tmp_path_factory):
+    """Fixture to create a CareerCoachAgent with a stubbed OpenAI client and its own data directory."""
+    # The agent needs a key to start, but the stub means it is never sent anywhere
+    with patch.dict(os.environ, {"OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "sk-test"}):
+        # pytest removes old temporary directories, so no cleanup is needed
+        agent = CareerCoachAgent(user_data_dir=str(tmp_path_factory.mktemp("career_coach")))
+    agent.client = MagicMock()
+    agent.client.chat.completions.create.side_effect = _fake_completion
+    return agent
 
 
 def test_career_coach_basic_flow(career_coach):
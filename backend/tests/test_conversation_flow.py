@@ -6,11 +6,12 @@ This script instantiates the ConversationFlow class and validates the basic stru
 by printing information about each phase and transitions.
 """
 
-import sys
 import os
+import sys
 
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":
+    # Run as a script: add the backend directory to the path (pytest uses pytest.ini)
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.career_coach.conversation_flow import ConversationFlow, ConversationPhase
 